@@ -1,13 +1,13 @@
 """Configuration management for RSS scraper using Pydantic Settings."""
 
+import hashlib
+import json
+from functools import cache, cached_property, lru_cache
 from typing import Dict, List, Optional
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
-
 
 class ScraperConfig(BaseSettings):
     """Configuration settings for the RSS scraper.
@@ -41,6 +41,37 @@ class ScraperConfig(BaseSettings):
         alias="USE_PLAYWRIGHT",
         description="Enable Playwright for JavaScript-heavy pages"
     )
+    js_scan_chars: int = Field(
+        default=8192,
+        alias="JS_SCAN_CHARS",
+        ge=1024,
+        le=1048576,
+        description="Length of the page prefix searched for signs that JavaScript rendering is needed"
+    )
+    playwright_pool_size: int = Field(
+        default=4,
+        alias="PLAYWRIGHT_POOL_SIZE",
+        ge=1,
+        le=16,
+        description="Maximum browser contexts (and pages) rendering at the same time"
+    )
+    playwright_links_only: bool = Field(
+        default=False,
+        alias="PLAYWRIGHT_LINKS_ONLY",
+        description="Return only the links of rendered pages instead of their full HTML"
+    )
+    playwright_ready_selector: Optional[str] = Field(
+        default=None,
+        alias="PLAYWRIGHT_READY_SELECTOR",
+        description="CSS selector that marks a rendered page as ready (e.g. 'main, article')"
+    )
+    playwright_ready_timeout_ms: int = Field(
+        default=3000,
+        alias="PLAYWRIGHT_READY_TIMEOUT_MS",
+        ge=100,
+        le=30000,
+        description="Maximum time to wait for a rendered page to become ready"
+    )
     max_retries: int = Field(
         default=3,
         alias="MAX_RETRIES",
@@ -48,6 +79,20 @@ class ScraperConfig(BaseSettings):
         le=10,
         description="Maximum retry attempts for failed requests"
     )
+    max_concurrent_entries: int = Field(
+        default=20,
+        alias="MAX_CONCURRENT_ENTRIES",
+        ge=1,
+        le=200,
+        description="Maximum feed entries processed at the same time"
+    )
+    max_concurrent_feeds: int = Field(
+        default=32,
+        alias="MAX_CONCURRENT_FEEDS",
+        ge=1,
+        le=128,
+        description="Maximum feeds scraped at the same time"
+    )
     
     # Output Configuration
     output_json: str = Field(
@@ -55,6 +100,11 @@ class ScraperConfig(BaseSettings):
         alias="OUTPUT_JSON",
         description="Path to generated JSON file"
     )
+    feed_cache_json: str = Field(
+        default="data/feed_cache.json",
+        alias="FEED_CACHE_JSON",
+        description="Path to cache of feed validators and items between runs"
+    )
     
     # Environment
     environment: str = Field(
@@ -118,10 +168,29 @@ class ScraperConfig(BaseSettings):
             return v.lower() in ("true", "1", "yes", "on")
         return bool(v)
     
-    @property
+    @classmethod
+    def trusted(cls, **values) -> "ScraperConfig":
+        """Build a configuration from already-valid values.
+        
+        Skips reading the environment and .env file and skips field
+        validation; fields not given keep their defaults. Intended for
+        tests and other callers that construct settings in code.
+        
+        Args:
+            **values: Field values keyed by field name
+            
+        Returns:
+            ScraperConfig built without validation
+        """
+        return cls.model_construct(**values)
+    
+    @cached_property
     def affiliate_tags(self) -> Dict[str, str]:
         """Get affiliate tags mapping.
         
+        Built once per configuration instance since it is read for every
+        processed link.
+        
         Returns:
             Dictionary mapping domains to affiliate tags
         """
@@ -130,6 +199,16 @@ class ScraperConfig(BaseSettings):
             "amazon.ca": self.amazon_tag_ca,
         }
     
+    @property
+    def affiliate_fingerprint(self) -> str:
+        """Get a digest of the settings that shape processed affiliate links.
+        
+        Returns:
+            SHA-256 hex digest of the affiliate tags mapping
+        """
+        tags = json.dumps(sorted(self.affiliate_tags.items()))
+        return hashlib.sha256(tags.encode("utf-8")).hexdigest()
+    
     def validate_config(self) -> None:
         """Validate configuration and check for required settings.
         
@@ -149,20 +228,24 @@ class ScraperConfig(BaseSettings):
             )
 
 
-# Global configuration instance - initialized on first access
-_config: Optional[ScraperConfig] = None
+@cache
+def _load_env() -> None:
+    """Load the .env file into the process environment exactly once."""
+    load_dotenv()
 
 
+@lru_cache(maxsize=1)
 def get_config() -> ScraperConfig:
     """Get the global configuration instance.
     
+    The instance is created on first access and memoized, so concurrent
+    callers always share a single validated configuration.
+    
     Returns:
         ScraperConfig: The configuration instance
     """
-    global _config
-    if _config is None:
-        _config = ScraperConfig()
-    return _config
+    _load_env()
+    return ScraperConfig()
 
 
 def reload_config() -> ScraperConfig:
@@ -171,7 +254,6 @@ def reload_config() -> ScraperConfig:
     Returns:
         ScraperConfig: New configuration instance
     """
-    global _config
     load_dotenv(override=True)
-    _config = ScraperConfig()
-    return _config
\ No newline at end of file
+    get_config.cache_clear()
+    return get_config()
@@ -0,0 +1,136 @@
+"""Persistent cache of feed validators and processed items between runs."""
+
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from pydantic import TypeAdapter
+
+from .models import CACHED_CONTEXT, CachedFeed, FeedItem
+
+logger = logging.getLogger(__name__)
+
+_CACHE_ADAPTER = TypeAdapter(Dict[str, CachedFeed])
+
+
+class FeedCache:
+    """JSON sidecar cache keyed by feed URL.
+    
+    Lets the scraper send conditional requests (If-None-Match /
+    If-Modified-Since) and reuse items from feeds or entries that have not
+    changed since the previous run.
+    """
+    
+    def __init__(self, path: str, affiliate_fingerprint: Optional[str] = None):
+        """Initialize an empty feed cache backed by a JSON file.
+        
+        Args:
+            path: Location of the JSON cache file
+            affiliate_fingerprint: Fingerprint of the current affiliate
+                settings; feeds cached under other settings are ignored
+        """
+        self.path = Path(path)
+        self.affiliate_fingerprint = affiliate_fingerprint
+        self._feeds: Dict[str, CachedFeed] = {}
+        self._dirty = False
+    
+    def load(self) -> None:
+        """Load cached feeds from disk, starting empty if the file is unusable."""
+        try:
+            # Reason: Cached titles and summaries are already unescaped;
+            # unescaping them again would turn "&amp;lt;" into "<"
+            self._feeds = _CACHE_ADAPTER.validate_json(
+                self.path.read_bytes(), context=CACHED_CONTEXT
+            )
+        except FileNotFoundError:
+            self._feeds = {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable feed cache {self.path}: {e}")
+            self._feeds = {}
+        self._dirty = False
+    
+    def save(self) -> None:
+        """Write the cache to disk if it changed since it was loaded."""
+        if not self._dirty:
+            return
+        
+        # Reason: Write to a temporary file and swap it in with os.replace, so
+        # a run killed mid-write never leaves a truncated cache behind
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(_CACHE_ADAPTER.dump_json(self._feeds))
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            logger.warning(f"Failed to save feed cache {self.path}: {e}")
+    
+    def get(self, feed_url: str) -> Optional[CachedFeed]:
+        """Get the cached state of a feed.
+        
+        Args:
+            feed_url: URL of the RSS feed
+            
+        Returns:
+            CachedFeed from the previous run, or None if not cached or
+            cached under different affiliate settings
+        """
+        cached = self._feeds.get(feed_url)
+        # Reason: Cached items carry the affiliate tags they were built with,
+        # so after a tag change they must be rebuilt rather than republished
+        if cached and cached.affiliate_fingerprint != self.affiliate_fingerprint:
+            return None
+        return cached
+    
+    def conditional_headers(self, feed_url: str) -> Dict[str, str]:
+        """Build conditional request headers for a cached feed.
+        
+        Args:
+            feed_url: URL of the RSS feed
+            
+        Returns:
+            If-None-Match / If-Modified-Since headers, empty if not cached
+        """
+        cached = self.get(feed_url)
+        headers = {}
+        if cached and cached.etag:
+            headers['If-None-Match'] = cached.etag
+        if cached and cached.last_modified:
+            headers['If-Modified-Since'] = cached.last_modified
+        return headers
+    
+    def update(
+        self,
+        feed_url: str,
+        items: List[FeedItem],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        content_hash: Optional[str] = None,
+        watermark: Optional[datetime] = None
+    ) -> None:
+        """Store the outcome of scraping a feed.
+        
+        Args:
+            feed_url: URL of the RSS feed
+            items: Feed items produced from the response
+            etag: ETag response header, if any
+            last_modified: Last-Modified response header, if any
+            content_hash: SHA-256 hex digest of the response body
+            watermark: Newest entry publication date in the response
+        """
+        try:
+            self._feeds[feed_url] = CachedFeed(
+                etag=etag,
+                last_modified=last_modified,
+                content_hash=content_hash,
+                watermark=watermark,
+                affiliate_fingerprint=self.affiliate_fingerprint,
+                items=items
+            )
+            self._dirty = True
+        except Exception as e:
+            # Reason: Caching is an optimization and must never fail a scrape
+            logger.warning(f"Failed to cache feed {feed_url}: {e}")
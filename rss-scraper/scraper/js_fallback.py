@@ -1,15 +1,55 @@
 """JavaScript rendering fallback using Playwright for heavy dynamic content."""
 
 import asyncio
+import html
 import logging
-from typing import Optional
-
-from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError, Browser, BrowserContext, Playwright
+import re
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Optional
 
 from .config import ScraperConfig
 
+# Reason: Playwright is imported where a browser is actually used so runs
+# with USE_PLAYWRIGHT disabled never pay for loading it
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Page, Playwright, Route
+
 logger = logging.getLogger(__name__)
 
+# Common indicators that a page needs JavaScript to render its content,
+# lowercased so they can be matched with plain substring searches against
+# a lowercased page prefix
+_JS_INDICATORS = tuple(indicator.lower() for indicator in (
+    'Loading...',
+    'Please enable JavaScript',
+    '<div id="root"></div>',
+    '<div id="app"></div>',
+    'data-reactroot',
+    'data-react-',
+    'ng-app',
+    'vue-',
+    'backbone-',
+    'angular-',
+    'ember-',
+))
+
+# Resource types and tracker hosts that are not needed to extract page
+# content; checked per request by _block_resource
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+_BLOCKED_HOST_PATTERN = re.compile(
+    r"(?:doubleclick|googletagmanager|googlesyndication|google-analytics|hotjar|segment|amplitude)\.",
+    re.IGNORECASE
+)
+
+# Collects the absolute URL of every link on a rendered page
+_LINKS_SCRIPT = "() => Array.from(document.querySelectorAll('a[href]'), a => a.href)"
+
+# Shared renderer reused across fetch_with_js_fallback calls so Chromium is
+# launched once per process instead of once per URL
+_renderer: Optional["JavaScriptRenderer"] = None
+_renderer_stack: Optional[AsyncExitStack] = None
+_renderer_lock = asyncio.Lock()
+
 
 class JavaScriptRenderer:
     """Handles JavaScript-heavy page rendering using Playwright.
@@ -18,18 +58,41 @@ class JavaScriptRenderer:
     to retrieve dynamic content that requires JavaScript execution.
     """
     
-    def __init__(self, config: ScraperConfig):
+    __slots__ = (
+        "config",
+        "browser",
+        "context",
+        "playwright",
+        "_owns_browser",
+        "_contexts",
+        "_idle_contexts",
+        "_context_slots",
+        "_pages",
+    )
+    
+    def __init__(self, config: ScraperConfig, browser: Optional["Browser"] = None):
         """Initialize JavaScript renderer with configuration.
         
         Args:
             config: Scraper configuration instance
+            browser: Already launched browser to create the context in (optional).
+                The renderer then only owns its context and leaves the browser
+                running on exit.
         """
         self.config = config
-        self.browser: Optional[Browser] = None
-        self.context: Optional[BrowserContext] = None
-        self.playwright: Optional[Playwright] = None
+        self.browser: Optional["Browser"] = browser
+        self.context: Optional["BrowserContext"] = None
+        self.playwright: Optional["Playwright"] = None
+        self._owns_browser = browser is None
+        # Contexts created by this renderer; idle ones are reused by later
+        # pages and the semaphore caps them at config.playwright_pool_size
+        self._contexts: List["BrowserContext"] = []
+        self._idle_contexts: List["BrowserContext"] = []
+        self._context_slots: Optional[asyncio.Semaphore] = None
+        # One long-lived page per context, navigated to each leased URL
+        self._pages: Dict["BrowserContext", "Page"] = {}
     
-    async def __aenter__(self):
+    async def __aenter__(self) -> "JavaScriptRenderer":
         """Async context manager entry."""
         if self.config.use_playwright:
             await self._initialize_browser()
@@ -46,32 +109,26 @@ class JavaScriptRenderer:
             Exception: If browser initialization fails
         """
         try:
-            self.playwright = await async_playwright().start()
+            if self._owns_browser:
+                from playwright.async_api import async_playwright
+                
+                self.playwright = await async_playwright().start()
+                
+                # Launch browser with optimized settings
+                self.browser = await self.playwright.chromium.launch(
+                    headless=True,
+                    args=[
+                        '--no-sandbox',
+                        '--disable-dev-shm-usage',
+                        '--disable-gpu',
+                        '--disable-extensions',
+                        '--disable-plugins',
+                    ]
+                )
             
-            # Launch browser with optimized settings
-            self.browser = await self.playwright.chromium.launch(
-                headless=True,
-                args=[
-                    '--no-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-gpu',
-                    '--disable-extensions',
-                    '--disable-plugins',
-                    '--disable-images',  # Don't load images for faster rendering
-                ]
-            )
-            
-            # Create browser context with optimized settings
-            self.context = await self.browser.new_context(
-                viewport={'width': 1280, 'height': 720},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                java_script_enabled=True,
-                ignore_https_errors=True,
-                # Disable images and other resources for faster loading
-                extra_http_headers={
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
-                }
-            )
+            self.context = await self._new_context()
+            self._idle_contexts.append(self.context)
+            self._context_slots = asyncio.Semaphore(self.config.playwright_pool_size)
             
             logger.info("Playwright browser initialized successfully")
             
@@ -80,30 +137,110 @@ class JavaScriptRenderer:
             await self._cleanup_browser()
             raise
     
-    async def _cleanup_browser(self) -> None:
-        """Clean up browser resources."""
-        try:
-            if self.context:
-                await self.context.close()
-                self.context = None
-            
-            if self.browser:
-                await self.browser.close()
-                self.browser = None
-            
-            if hasattr(self, 'playwright') and self.playwright:
-                await self.playwright.stop()
-                self.playwright = None
+    async def _new_context(self) -> "BrowserContext":
+        """Create a browser context with optimized settings.
+        
+        Returns:
+            New BrowserContext tracked by this renderer
             
-        except Exception as e:
-            logger.warning(f"Error during browser cleanup: {e}")
+        Raises:
+            RuntimeError: If no browser is available
+        """
+        if self.browser is None:
+            raise RuntimeError("Playwright browser was not launched")
+        
+        context = await self.browser.new_context(
+            viewport={'width': 1280, 'height': 720},
+            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            java_script_enabled=True,
+            ignore_https_errors=True,
+            # Disable images and other resources for faster loading
+            extra_http_headers={
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
+            }
+        )
+        self._contexts.append(context)
+        
+        # Block images, stylesheets, fonts, media and trackers for every
+        # page in the context; registered once instead of per page
+        await context.route("**/*", _block_resource)
+        return context
+    
+    @asynccontextmanager
+    async def _lease_context(self) -> AsyncIterator["BrowserContext"]:
+        """Borrow an idle browser context, creating one while under the pool size.
+        
+        Yields:
+            BrowserContext reserved for the caller until the block exits
+        """
+        if self._context_slots is None:
+            # Reason: Context was assigned directly rather than created by
+            # _initialize_browser, so it is leased exclusively as a pool of one
+            if self.context is None:
+                raise RuntimeError("Playwright browser not initialized")
+            self._contexts, self._idle_contexts = [self.context], [self.context]
+            self._context_slots = asyncio.Semaphore(1)
+        
+        async with self._context_slots:
+            context = self._idle_contexts.pop() if self._idle_contexts else await self._new_context()
+            try:
+                yield context
+            finally:
+                try:
+                    await context.clear_cookies()
+                except Exception as e:
+                    logger.warning(f"Error clearing browser context cookies: {e}")
+                self._idle_contexts.append(context)
+    
+    async def _cleanup_browser(self) -> None:
+        """Clean up browser resources.
+        
+        Teardown is ordered (contexts, then browser, then Playwright) since
+        each stage needs the next one alive; only the pooled contexts are
+        closed concurrently. A failing stage is logged and later stages
+        still run.
+        """
+        contexts = self._contexts or ([self.context] if self.context else [])
+        self._contexts, self._idle_contexts, self._context_slots = [], [], None
+        self._pages.clear()
+        self.context = None
+        results = await asyncio.gather(
+            *(context.close() for context in contexts),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"Error closing browser context: {result}")
+        
+        # Reason: An injected browser is shared with other renderers, so
+        # only its context belongs to this renderer
+        if self.browser and self._owns_browser:
+            browser, self.browser = self.browser, None
+            try:
+                await browser.close()
+            except Exception as e:
+                logger.warning(f"Error closing browser: {e}")
+        
+        if self.playwright:
+            playwright, self.playwright = self.playwright, None
+            try:
+                await playwright.stop()
+            except Exception as e:
+                logger.warning(f"Error stopping Playwright: {e}")
     
-    async def fetch_js_content(self, url: str, timeout: int = 30000) -> Optional[str]:
+    async def fetch_js_content(
+        self,
+        url: str,
+        timeout: int = 30000,
+        ready_selector: Optional[str] = None
+    ) -> Optional[str]:
         """Fetch content from JavaScript-heavy page.
         
         Args:
             url: URL to fetch content from
             timeout: Timeout in milliseconds (default: 30 seconds)
+            ready_selector: CSS selector that marks the page as ready
+                (optional, defaults to config.playwright_ready_selector)
             
         Returns:
             HTML content after JavaScript execution, or None if failed
@@ -116,43 +253,11 @@ class JavaScriptRenderer:
             logger.warning("Playwright browser not initialized")
             return None
         
-        page = None
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+        
         try:
-            page = await self.context.new_page()
-            
-            # Set up resource blocking for better performance
-            await page.route("**/*.{jpg,jpeg,png,gif,css,woff,woff2}", 
-                           lambda route: route.abort())
-            
-            # Navigate to page with timeout
-            logger.debug(f"Fetching JS content from: {url}")
-            await page.goto(
-                url, 
-                wait_until='networkidle', 
-                timeout=timeout
-            )
-            
-            # Wait for content to be dynamically loaded
-            await page.wait_for_function("""
-                () => {
-                    return document.readyState === 'complete' && 
-                           document.querySelector('body') && 
-                           document.querySelector('body').children.length > 0;
-                }
-            """, timeout=10000)
-            
-            # Additional wait for dynamic content
-            await asyncio.sleep(2)  # Give dynamic content time to load
-            
-            # Get page content
-            content = await page.content()
-            
-            if content and len(content) > 100:  # Basic content validation
-                logger.debug(f"Successfully fetched JS content ({len(content)} chars)")
-                return content
-            else:
-                logger.warning(f"Fetched content appears empty or too short: {len(content) if content else 0} chars")
-                return None
+            async with self._lease_context() as context:
+                return await self._render_page(context, url, timeout, ready_selector)
             
         except PlaywrightTimeoutError as e:
             logger.warning(f"Playwright timeout for {url}: {e}")
@@ -161,15 +266,121 @@ class JavaScriptRenderer:
         except Exception as e:
             logger.error(f"Playwright failed for {url}: {e}")
             return None
+    
+    async def _render_page(
+        self,
+        context: "BrowserContext",
+        url: str,
+        timeout: int,
+        ready_selector: Optional[str]
+    ) -> Optional[str]:
+        """Render a URL in the leased context's page.
         
-        finally:
-            if page:
-                try:
-                    await page.close()
-                except Exception as e:
-                    logger.warning(f"Error closing page: {e}")
+        The page is created on first use and then navigated to each later
+        URL instead of opening and closing a page per render. A page whose
+        render raises is closed and replaced on the next lease.
+        
+        Args:
+            context: Leased browser context to render in
+            url: URL to fetch content from
+            timeout: Navigation timeout in milliseconds
+            ready_selector: CSS selector that marks the page as ready (optional)
+            
+        Returns:
+            HTML content after JavaScript execution (only its links when
+            config.playwright_links_only is set), or None if too short
+            
+        Raises:
+            PlaywrightTimeoutError: If navigation times out
+        """
+        page = self._pages.pop(context, None)
+        if page is None:
+            page = await context.new_page()
+        
+        try:
+            content = await self._load_page(page, url, timeout, ready_selector)
+        except BaseException:
+            try:
+                await page.close()
+            except Exception as e:
+                logger.warning(f"Error closing page: {e}")
+            raise
+        
+        self._pages[context] = page
+        return content
+    
+    async def _load_page(
+        self,
+        page: "Page",
+        url: str,
+        timeout: int,
+        ready_selector: Optional[str]
+    ) -> Optional[str]:
+        """Navigate a page to a URL and read its rendered content.
+        
+        Args:
+            page: Page to navigate
+            url: URL to fetch content from
+            timeout: Navigation timeout in milliseconds
+            ready_selector: CSS selector that marks the page as ready (optional)
+            
+        Returns:
+            HTML content after JavaScript execution (only its links when
+            config.playwright_links_only is set), or None if too short
+            
+        Raises:
+            PlaywrightTimeoutError: If navigation times out
+        """
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+        
+        # Navigate to page with timeout
+        # Reason: networkidle waits for a fixed 500 ms of network silence
+        # and stalls on pages with polling or analytics beacons
+        logger.debug(f"Fetching JS content from: {url}")
+        await page.goto(
+            url, 
+            wait_until='domcontentloaded', 
+            timeout=timeout
+        )
+        
+        # Wait until the page shows it has rendered, keeping whatever
+        # content is there if it never does
+        selector = ready_selector or self.config.playwright_ready_selector
+        ready_timeout = self.config.playwright_ready_timeout_ms
+        try:
+            if selector:
+                await page.wait_for_selector(selector, state='attached', timeout=ready_timeout)
+            else:
+                await page.wait_for_function("""
+                    () => {
+                        return document.readyState === 'complete' && 
+                               document.querySelector('body') && 
+                               document.querySelector('body').children.length > 0;
+                    }
+                """, timeout=ready_timeout)
+        except PlaywrightTimeoutError:
+            logger.debug(f"Readiness wait timed out for {url}, using current content")
+        
+        if self.config.playwright_links_only:
+            # Reason: Only anchors are used downstream, so collect their
+            # URLs in the browser instead of serializing the whole DOM
+            hrefs = await page.evaluate(_LINKS_SCRIPT)
+            if not hrefs:
+                logger.warning(f"No links found on rendered page {url}")
+                return None
+            return "".join(f'<a href="{html.escape(href)}"></a>' for href in hrefs)
+        
+        # Get page content
+        content = await page.content()
+        
+        if content and len(content) > 100:  # Basic content validation
+            logger.debug(f"Successfully fetched JS content ({len(content)} chars)")
+            return content
+        else:
+            logger.warning(f"Fetched content appears empty or too short: {len(content) if content else 0} chars")
+            return None
     
-    async def is_js_required(self, url: str, static_content: str) -> bool:
+    def is_js_required(self, url: str, static_content: Optional[str]) -> bool:
         """Determine if JavaScript rendering is likely required for a page.
         
         Args:
@@ -179,36 +390,87 @@ class JavaScriptRenderer:
         Returns:
             True if JavaScript rendering is likely needed
         """
-        if not static_content:
-            return True
-        
-        # Check for common indicators that JS is required
-        js_indicators = [
-            'Loading...',
-            'Please enable JavaScript',
-            '<div id="root"></div>',
-            '<div id="app"></div>',
-            'data-reactroot',
-            'data-react-',
-            'ng-app',
-            'vue-',
-            'backbone-',
-            'angular-',
-            'ember-'
-        ]
-        
-        content_lower = static_content.lower()
-        for indicator in js_indicators:
-            if indicator.lower() in content_lower:
-                logger.debug(f"JS indicator found: {indicator}")
-                return True
+        return _is_js_required(static_content, self.config.js_scan_chars)
+
+
+def _is_js_required(static_content: Optional[str], scan_chars: int) -> bool:
+    """Determine if JavaScript rendering is likely required for static content.
+    
+    Only the first scan_chars characters are inspected, where SPA root
+    elements and loading banners appear.
+    
+    Args:
+        static_content: Content fetched without JavaScript
+        scan_chars: Length of the content prefix to inspect
         
-        # Check if content is suspiciously short (might be placeholder)
-        if len(static_content.strip()) < 500:
-            logger.debug("Content is very short, JS might be required")
+    Returns:
+        True if JavaScript rendering is likely needed
+    """
+    if not static_content:
+        return True
+    
+    head = static_content[:scan_chars]
+    
+    # Check for common indicators that JS is required
+    # Reason: Lowercasing the prefix once and running substring searches is
+    # an order of magnitude faster than a re.IGNORECASE alternation, which
+    # gets no literal fast path
+    lowered = head.lower()
+    for indicator in _JS_INDICATORS:
+        if indicator in lowered:
+            logger.debug(f"JS indicator found: {indicator}")
             return True
+    
+    # Check if content is suspiciously short (might be placeholder)
+    if len(head.strip()) < 500:
+        logger.debug("Content is very short, JS might be required")
+        return True
+    
+    return False
+
+
+async def _block_resource(route: "Route") -> None:
+    """Abort requests for resources that are not needed to extract content.
+    
+    Args:
+        route: Intercepted Playwright route
+    """
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or _BLOCKED_HOST_PATTERN.search(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def get_renderer(config: ScraperConfig) -> JavaScriptRenderer:
+    """Get the shared JavaScript renderer, launching the browser on first use.
+    
+    Args:
+        config: Scraper configuration used if the renderer is created
+        
+    Returns:
+        Initialized JavaScriptRenderer shared by all callers
         
-        return False
+    Raises:
+        Exception: If browser initialization fails
+    """
+    global _renderer, _renderer_stack
+    async with _renderer_lock:
+        renderer = _renderer
+        if renderer is None:
+            stack = AsyncExitStack()
+            renderer = await stack.enter_async_context(JavaScriptRenderer(config))
+            _renderer, _renderer_stack = renderer, stack
+        return renderer
+
+
+async def close_renderer() -> None:
+    """Shut down the shared JavaScript renderer if one was started."""
+    global _renderer, _renderer_stack
+    async with _renderer_lock:
+        stack, _renderer, _renderer_stack = _renderer_stack, None, None
+        if stack:
+            await stack.aclose()
 
 
 async def fetch_with_js_fallback(
@@ -219,7 +481,9 @@ async def fetch_with_js_fallback(
     """Fetch content with JavaScript fallback if needed.
     
     Convenience function that uses static content if available and good,
-    or falls back to JavaScript rendering if necessary.
+    or falls back to JavaScript rendering if necessary. Rendering goes
+    through the shared renderer from get_renderer(), which is only
+    started once static content has been found insufficient.
     
     Args:
         url: URL to fetch
@@ -232,26 +496,27 @@ async def fetch_with_js_fallback(
     if not config.use_playwright:
         return static_content
     
-    async with JavaScriptRenderer(config) as renderer:
-        # If we have static content, check if JS is needed
-        if static_content:
-            if not await renderer.is_js_required(url, static_content):
-                logger.debug("Static content appears sufficient, using it")
-                return static_content
-        
-        # Try JavaScript rendering
-        logger.info(f"Attempting JavaScript rendering for: {url}")
-        js_content = await renderer.fetch_js_content(url)
-        
-        if js_content:
-            return js_content
-        
-        # Fallback to static content if JS rendering failed
-        if static_content:
-            logger.warning("JS rendering failed, falling back to static content")
-            return static_content
-        
-        return None
+    # If we have static content, check if JS is needed before touching the
+    # renderer so sufficient pages never launch or lease a browser
+    if static_content and not _is_js_required(static_content, config.js_scan_chars):
+        logger.debug("Static content appears sufficient, using it")
+        return static_content
+    
+    renderer = await get_renderer(config)
+    
+    # Try JavaScript rendering
+    logger.info(f"Attempting JavaScript rendering for: {url}")
+    js_content = await renderer.fetch_js_content(url)
+    
+    if js_content:
+        return js_content
+    
+    # Fallback to static content if JS rendering failed
+    if static_content:
+        logger.warning("JS rendering failed, falling back to static content")
+        return static_content
+    
+    return None
 
 
 # Legacy compatibility function to match INITIAL.md example
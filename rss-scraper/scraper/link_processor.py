@@ -2,18 +2,62 @@
 
 import asyncio
 import logging
-from typing import List
-from urllib.parse import urlparse, urlunparse, parse_qs, urlencode
+import time
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterator, List, Tuple, Union
+from urllib.parse import quote_plus, urlparse, urlsplit
 
 import httpx
-from bs4 import BeautifulSoup
-from pydantic import HttpUrl
+from lxml import html as lxml_html  # type: ignore
 
 from .models import ProcessedLink
 from .config import ScraperConfig
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of distinct URLs memoized by the URL transformation helpers
+_URL_CACHE_SIZE = 4096
+
+# Maximum number of links processed (redirect-resolved) at the same time
+_MAX_CONCURRENT_LINKS = 64
+
+# Redirect chains are stable for hours, so resolved targets are reused
+# within this window instead of re-issuing HEAD requests
+_REDIRECT_CACHE_TTL = 3600.0
+_REDIRECT_CACHE_SIZE = 8192
+
+# Registered domains of known affiliate networks
+_NETWORK_DOMAINS = {
+    "amazon.com": "amazon",
+    "amazon.ca": "amazon",
+    "amazon.co.uk": "amazon",
+    "amzn.to": "amazon",
+    "clickbank.net": "clickbank",
+    "cblinks.com": "clickbank",
+    "shareasale.com": "shareasale",
+    "cj.com": "commission_junction",
+    "tkqlhce.com": "commission_junction",
+    "jdoqocy.com": "commission_junction",
+    "rakuten.com": "rakuten",
+    "linksynergy.com": "rakuten",
+}
+
+# Merchant domains that serve product pages directly and never redirect to
+# another site; links already pointing at them skip redirect resolution
+_TERMINAL_DOMAINS = (
+    "amazon.com",
+    "amazon.ca",
+    "amazon.co.uk",
+    "walmart.com",
+    "bestbuy.com",
+    "target.com",
+    "ebay.com",
+)
+
+# Content is handed to lxml as UTF-8 bytes so documents carrying an XML
+# encoding declaration parse the same as plain HTML strings
+_HTML_PARSER = lxml_html.HTMLParser(encoding="utf-8")
+
 
 class LinkProcessor:
     """Handles URL processing, redirect resolution, and affiliate link management.
@@ -36,7 +80,15 @@ class LinkProcessor:
             "amazon": ["tag", "AssociateTag", "linkCode", "linkId", "creativeASIN"],
             "general": ["tag", "affid", "ref", "utm_source", "utm_medium", "utm_campaign", "aff"]
         }
-        
+        # Precompute the parameter set checked for every processed link
+        self._params_to_remove = frozenset(
+            param for param_list in self.affiliate_params.values() for param in param_list
+        )
+        # Caps concurrent link processing across all pages handled by this instance
+        self._link_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_LINKS)
+        # Resolved redirect targets: url -> (expires_at, resolved_url)
+        self._redirect_cache: Dict[str, Tuple[float, str]] = {}
+    
     async def process_content_links(
         self, 
         content: str, 
@@ -57,32 +109,58 @@ class LinkProcessor:
             return []
         
         try:
-            soup = BeautifulSoup(content, 'lxml')
+            tree = lxml_html.fromstring(content.encode("utf-8"), parser=_HTML_PARSER)
         except Exception as e:
             logger.warning(f"Failed to parse HTML content: {e}")
             return []
         
-        links = []
-        anchors = soup.find_all('a', href=True)
-        
-        # Process links concurrently for better performance
-        tasks = []
-        for anchor in anchors:
-            original_url = anchor.get('href', '').strip()
+        # Collect processable URLs in anchor order
+        urls = []
+        for anchor in tree.iter('a'):
+            original_url = (anchor.get('href') or '').strip()
             if original_url and self._should_process_link(original_url, rss_domain):
-                task = self._process_single_link(original_url, client)
-                tasks.append(task)
+                urls.append(original_url)
+        
+        if not urls:
+            return []
+        
+        # Reason: Pages repeat the same link (nav, sidebar, body), so each
+        # distinct URL is resolved once and shared by all of its anchors
+        unique_urls = list(dict.fromkeys(urls))
         
-        if tasks:
-            # Reason: Process links concurrently to improve performance
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            for result in results:
-                if isinstance(result, ProcessedLink):
-                    links.append(result)
-                elif isinstance(result, Exception):
-                    logger.warning(f"Failed to process link: {result}")
+        # Reason: Process links concurrently, bounded so pages with thousands
+        # of anchors don't open thousands of sockets at once
+        processed = {}
+        for next_done in asyncio.as_completed(
+            [self._process_link_bounded(url, client) for url in unique_urls]
+        ):
+            url, result = await next_done
+            if isinstance(result, ProcessedLink):
+                processed[url] = result
+            elif isinstance(result, Exception):
+                logger.warning(f"Failed to process link: {result}")
         
-        return links
+        return [processed[url] for url in urls if url in processed]
+    
+    async def _process_link_bounded(
+        self,
+        url: str,
+        client: httpx.AsyncClient
+    ) -> Tuple[str, Union[ProcessedLink, Exception]]:
+        """Process a single link while holding the link concurrency semaphore.
+        
+        Args:
+            url: Original URL to process
+            client: HTTP client for requests
+            
+        Returns:
+            Tuple of the URL and its ProcessedLink, or the exception raised
+        """
+        async with self._link_semaphore:
+            try:
+                return url, await self._process_single_link(url, client)
+            except Exception as e:
+                return url, e
     
     def _should_process_link(self, url: str, rss_domain: str) -> bool:
         """Determine if a link should be processed.
@@ -144,24 +222,26 @@ class LinkProcessor:
             # Step 4: Detect affiliate network
             network = self._detect_affiliate_network(final_url)
             
-            return ProcessedLink(
-                original=HttpUrl(original_url),
-                resolved=HttpUrl(resolved_url),
-                final=HttpUrl(final_url),
-                is_affiliate=final_url != clean_url,
-                network=network
-            )
+            # Reason: ProcessedLink validates the URL fields itself, so plain
+            # strings avoid building each HttpUrl twice
+            return ProcessedLink.model_validate({
+                "original": original_url,
+                "resolved": resolved_url,
+                "final": final_url,
+                "is_affiliate": final_url != clean_url,
+                "network": network
+            })
             
         except Exception as e:
             logger.warning(f"Failed to process link {original_url}: {e}")
             # Return minimal ProcessedLink on failure
-            return ProcessedLink(
-                original=HttpUrl(original_url),
-                resolved=HttpUrl(original_url),
-                final=HttpUrl(original_url),
-                is_affiliate=False,
-                network="unknown"
-            )
+            return ProcessedLink.model_validate({
+                "original": original_url,
+                "resolved": original_url,
+                "final": original_url,
+                "is_affiliate": False,
+                "network": "unknown"
+            })
     
     async def _resolve_redirects(
         self, 
@@ -179,8 +259,17 @@ class LinkProcessor:
         Returns:
             Final URL after following redirects
         """
+        if _is_terminal_domain(url):
+            return url
+        
+        cached = self._redirect_cache.get(url)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        
         current_url = url
         seen_urls = set()
+        # Only cache chains that were resolved without request errors
+        cacheable = True
         
         for _ in range(max_redirects):
             if current_url in seen_urls:
@@ -210,13 +299,31 @@ class LinkProcessor:
                 
             except httpx.RequestError as e:
                 logger.debug(f"Request error resolving redirects for {url}: {e}")
+                cacheable = False
                 break
             except Exception as e:
                 logger.debug(f"Unexpected error resolving redirects for {url}: {e}")
+                cacheable = False
                 break
         
+        if cacheable:
+            self._cache_redirect(url, current_url)
+        
         return current_url
     
+    def _cache_redirect(self, url: str, resolved_url: str) -> None:
+        """Remember a resolved redirect target for the cache TTL.
+        
+        Args:
+            url: Original URL
+            resolved_url: Final URL after following redirects
+        """
+        self._redirect_cache.pop(url, None)
+        if len(self._redirect_cache) >= _REDIRECT_CACHE_SIZE:
+            # Evict the oldest entry (dicts preserve insertion order)
+            self._redirect_cache.pop(next(iter(self._redirect_cache)))
+        self._redirect_cache[url] = (time.monotonic() + _REDIRECT_CACHE_TTL, resolved_url)
+    
     def _clean_affiliate_params(self, url: str) -> str:
         """Remove existing affiliate parameters from URL.
         
@@ -226,25 +333,12 @@ class LinkProcessor:
         Returns:
             URL with affiliate parameters removed
         """
+        # Reason: Most anchors carry no query string, so there is nothing to strip
+        if '?' not in url:
+            return url
+        
         try:
-            parsed = urlparse(url)
-            query_params = parse_qs(parsed.query, keep_blank_values=False)
-            
-            # Remove known affiliate parameters
-            params_to_remove = set()
-            for param_list in self.affiliate_params.values():
-                params_to_remove.update(param_list)
-            
-            # Filter out affiliate parameters
-            cleaned_params = {
-                key: value for key, value in query_params.items()
-                if key not in params_to_remove
-            }
-            
-            # Rebuild URL with cleaned parameters
-            new_query = urlencode(cleaned_params, doseq=True)
-            return urlunparse(parsed._replace(query=new_query))
-            
+            return _strip_affiliate_params(url, self._params_to_remove)
         except Exception as e:
             logger.warning(f"Failed to clean URL {url}: {e}")
             return url
@@ -259,35 +353,7 @@ class LinkProcessor:
             URL with affiliate tags added
         """
         try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-            
-            # Check if this is a supported affiliate domain
-            affiliate_tag = None
-            
-            for affiliate_domain, tag in self.config.affiliate_tags.items():
-                if affiliate_domain in domain:
-                    affiliate_tag = tag
-                    break
-            
-            if not affiliate_tag:
-                return url
-            
-            # Add affiliate parameter
-            query_params = parse_qs(parsed.query, keep_blank_values=False)
-            
-            # Use appropriate parameter name based on domain
-            if "amazon" in domain:
-                param_name = "tag"
-            else:
-                param_name = "aff"
-            
-            query_params[param_name] = [affiliate_tag]
-            
-            # Rebuild URL with affiliate tag
-            new_query = urlencode(query_params, doseq=True)
-            return urlunparse(parsed._replace(query=new_query))
-            
+            return _apply_affiliate_tag(url, tuple(self.config.affiliate_tags.items()))
         except Exception as e:
             logger.warning(f"Failed to add affiliate tags to {url}: {e}")
             return url
@@ -302,31 +368,167 @@ class LinkProcessor:
             Affiliate network name
         """
         try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-            
-            # Check for known affiliate networks
-            if any(amazon_domain in domain for amazon_domain in 
-                   ['amazon.com', 'amazon.ca', 'amazon.co.uk', 'amzn.to']):
-                return "amazon"
-            elif any(cb_domain in domain for cb_domain in 
-                     ['clickbank.net', 'cblinks.com']):
-                return "clickbank"
-            elif 'shareasale.com' in domain:
-                return "shareasale"
-            elif any(cj_domain in domain for cj_domain in 
-                     ['cj.com', 'tkqlhce.com', 'jdoqocy.com']):
-                return "commission_junction"
-            elif any(rakuten_domain in domain for rakuten_domain in 
-                     ['rakuten.com', 'linksynergy.com']):
-                return "rakuten"
-            
-            return "unknown"
-            
+            return _classify_host(urlsplit(url).hostname or "")
         except Exception:
             return "unknown"
 
 
+def _is_terminal_domain(url: str) -> bool:
+    """Check whether a URL already points at a known terminal merchant domain.
+    
+    Args:
+        url: URL to check
+        
+    Returns:
+        True if the host is one of _TERMINAL_DOMAINS or a subdomain of one
+    """
+    host = urlparse(url).hostname or ""
+    return any(
+        host == domain or host.endswith("." + domain)
+        for domain in _TERMINAL_DOMAINS
+    )
+
+
+def _split_query(url: str) -> Tuple[str, str, str]:
+    """Split a URL into the part before the query, the query and the fragment.
+    
+    Args:
+        url: URL to split
+        
+    Returns:
+        (base, query, fragment) where fragment includes its leading '#'
+    """
+    base, hash_sign, fragment = url.partition("#")
+    base, _, query = base.partition("?")
+    return base, query, hash_sign + fragment
+
+
+def _join_query(base: str, query: str, fragment: str) -> str:
+    """Reassemble a URL split by _split_query.
+    
+    Args:
+        base: URL up to (not including) the query
+        query: Raw query string without the leading '?'
+        fragment: Fragment including its leading '#', or empty
+        
+    Returns:
+        Reassembled URL, without a dangling '?' when the query is empty
+    """
+    return f"{base}?{query}{fragment}" if query else f"{base}{fragment}"
+
+
+def _drop_params(query: str, names: FrozenSet[str]) -> str:
+    """Remove parameters from a raw query string without re-encoding it.
+    
+    Args:
+        query: Raw query string without the leading '?'
+        names: Parameter names to remove
+        
+    Returns:
+        Query string with the named parameters (and empty pairs) removed
+    """
+    return "&".join(
+        pair for pair in query.split("&")
+        if pair and pair.partition("=")[0] not in names
+    )
+
+
+# Reason: Feeds repeat the same outbound URLs across items and runs, so the
+# pure URL transformations below are memoized on their (hashable) inputs.
+@lru_cache(maxsize=_URL_CACHE_SIZE)
+def _strip_affiliate_params(url: str, params_to_remove: FrozenSet[str]) -> str:
+    """Remove the given query parameters from a URL.
+    
+    Args:
+        url: URL to clean
+        params_to_remove: Query parameter names to drop
+        
+    Returns:
+        URL with the parameters removed
+    """
+    base, query, fragment = _split_query(url)
+    
+    # Filter out known affiliate parameters, keeping the rest verbatim
+    return _join_query(base, _drop_params(query, params_to_remove), fragment)
+
+
+@lru_cache(maxsize=_URL_CACHE_SIZE)
+def _apply_affiliate_tag(url: str, affiliate_tags: Tuple[Tuple[str, str], ...]) -> str:
+    """Add the matching affiliate tag to a URL.
+    
+    Args:
+        url: Clean URL to add affiliate tags to
+        affiliate_tags: (domain, tag) pairs from the configuration
+        
+    Returns:
+        URL with affiliate tag added, or unchanged if no domain matches
+    """
+    tags = dict(affiliate_tags)
+    
+    # Reason: Match the host and its parent domains like _classify_host, so
+    # look-alike hosts such as amazon.com.evil.net are never tagged
+    affiliate_domain = next(
+        (domain for domain in _parent_domains(urlsplit(url).hostname or "") if domain in tags),
+        None
+    )
+    if not affiliate_domain or not tags[affiliate_domain]:
+        return url
+    affiliate_tag = tags[affiliate_domain]
+    
+    # Use appropriate parameter name based on domain
+    if "amazon" in affiliate_domain:
+        param_name = "tag"
+    else:
+        param_name = "aff"
+    
+    tag_param = f"{param_name}={quote_plus(affiliate_tag)}"
+    
+    # No query or fragment to preserve, so the tag is simply appended
+    if '?' not in url and '#' not in url:
+        return f"{url}?{tag_param}"
+    
+    # Replace any existing value and append the affiliate parameter
+    base, query, fragment = _split_query(url)
+    query = _drop_params(query, frozenset((param_name,)))
+    return _join_query(base, f"{query}&{tag_param}" if query else tag_param, fragment)
+
+
+@lru_cache(maxsize=_URL_CACHE_SIZE)
+def _classify_host(host: str) -> str:
+    """Map a lowercase host name to the affiliate network that owns it.
+    
+    The host and each of its parent domains are looked up in
+    _NETWORK_DOMAINS, so www.amazon.co.uk resolves through amazon.co.uk.
+    
+    Args:
+        host: Lowercase host name without port
+        
+    Returns:
+        Affiliate network name
+    """
+    for domain in _parent_domains(host):
+        network = _NETWORK_DOMAINS.get(domain)
+        if network:
+            return network
+    
+    return "unknown"
+
+
+def _parent_domains(host: str) -> Iterator[str]:
+    """Yield a host name and each of its parent domains, longest first.
+    
+    Args:
+        host: Lowercase host name without port
+        
+    Yields:
+        Domains down to the two rightmost labels, e.g. www.amazon.co.uk,
+        amazon.co.uk, co.uk
+    """
+    labels = host.split(".")
+    for i in range(len(labels) - 1):
+        yield ".".join(labels[i:])
+
+
 async def create_link_processor(config: ScraperConfig) -> LinkProcessor:
     """Factory function to create a LinkProcessor instance.
     
@@ -336,4 +538,37 @@ async def create_link_processor(config: ScraperConfig) -> LinkProcessor:
     Returns:
         Configured LinkProcessor instance
     """
-    return LinkProcessor(config)
\ No newline at end of file
+    return LinkProcessor(config)
+
+
+def create_http_client(retries: int = 0, **overrides) -> httpx.AsyncClient:
+    """Factory function to create an HTTP client tuned for link processing.
+    
+    Redirect resolution fans out many HEAD requests to a handful of hosts,
+    so the client uses HTTP/2 to multiplex them over shared connections and
+    a connection pool large enough not to throttle concurrent tasks.
+    
+    Args:
+        retries: Connection attempts retried by the transport (default: none)
+        **overrides: Keyword arguments passed through to httpx.AsyncClient
+        
+    Returns:
+        Configured httpx.AsyncClient instance
+    """
+    options: Dict[str, Any] = {
+        "http2": True,
+        "limits": httpx.Limits(max_connections=512, max_keepalive_connections=256),
+        "timeout": httpx.Timeout(10.0, connect=3.0),
+    }
+    options.update(overrides)
+    
+    # Reason: Connect retries are a transport setting, and httpx ignores the
+    # client's http2/limits once a transport is given, so they move with it
+    if retries and "transport" not in options:
+        options["transport"] = httpx.AsyncHTTPTransport(
+            http2=options.pop("http2"),
+            limits=options.pop("limits"),
+            retries=retries
+        )
+    
+    return httpx.AsyncClient(**options)
@@ -1,8 +1,105 @@
 """Pydantic models for RSS scraper data validation."""
 
+import html
+import sys
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import List, Optional
-from pydantic import BaseModel, HttpUrl, Field, field_validator, ConfigDict
+from pydantic import BaseModel, HttpUrl, Field, TypeAdapter, ValidationError, ValidationInfo, field_validator, ConfigDict
+
+# Maximum number of distinct URL strings memoized by _parse_http_url
+_URL_CACHE_SIZE = 4096
+
+_HTTP_URL_ADAPTER = TypeAdapter(HttpUrl)
+
+_HTTP_SCHEMES = ("http://", "https://")
+
+# Longest title and summary kept by FeedItem; longer text is cut to fit
+# the trailing ellipsis within the limit
+_TITLE_MAX_LENGTH = 200
+_SUMMARY_MAX_LENGTH = 500
+_ELLIPSIS = "..."
+
+# Entities common in feed text, decoded with str.replace; "&amp;" must stay
+# last so "&amp;lt;" becomes "&lt;" rather than "<"
+_COMMON_ENTITIES = (
+    ("&lt;", "<"),
+    ("&gt;", ">"),
+    ("&quot;", '"'),
+    ("&#39;", "'"),
+    ("&amp;", "&"),
+)
+
+# Affiliate networks accepted by ProcessedLink.network
+_VALID_NETWORKS = frozenset({"amazon", "clickbank", "shareasale", "unknown"})
+
+
+@lru_cache(maxsize=_URL_CACHE_SIZE)
+def _cached_http_url(value: str) -> HttpUrl:
+    """Parse a URL string once; failures raise and are not cached."""
+    return _HTTP_URL_ADAPTER.validate_python(value)
+
+
+def _parse_http_url(value):
+    """Reuse the parsed HttpUrl for URL strings seen before.
+    
+    Args:
+        value: Raw field value
+        
+    Returns:
+        Cached HttpUrl for valid URL strings, otherwise the value unchanged
+        so the field's own validation reports the error
+    """
+    # Reason: Strings without an http(s) scheme can never be an HttpUrl, so
+    # they skip the cached parse and fail once in the field's validation
+    # instead of raising twice
+    if not isinstance(value, str) or not value[:8].lower().startswith(_HTTP_SCHEMES):
+        return value
+    
+    try:
+        return _cached_http_url(value)
+    except ValidationError:
+        return value
+
+
+# Validation context for FeedItems restored from the feed cache, whose
+# title and summary were already unescaped when first validated
+CACHED_CONTEXT = {"cached": True}
+
+
+def _is_cached(info: ValidationInfo) -> bool:
+    """Check whether a value is being validated from the feed cache.
+    
+    Args:
+        info: Validation info of the field being validated
+        
+    Returns:
+        True if validation was run with CACHED_CONTEXT
+    """
+    return bool(info.context and info.context.get("cached"))
+
+
+def _unescape(text: str) -> str:
+    """Decode HTML entities, skipping html.unescape for the common ones.
+    
+    Args:
+        text: Text that may contain HTML entities
+        
+    Returns:
+        Text with entities decoded, identical to html.unescape(text)
+    """
+    if "&" not in text:
+        return text
+    
+    # Reason: Only take the replace path when every "&" starts one of the
+    # common entities; anything else (&nbsp;, numeric refs, bare "&") needs
+    # the full HTML5 table
+    if text.count("&") != sum(text.count(entity) for entity, _ in _COMMON_ENTITIES):
+        return html.unescape(text)
+    
+    for entity, char in _COMMON_ENTITIES:
+        text = text.replace(entity, char)
+    return text
 
 
 class ProcessedLink(BaseModel):
@@ -40,6 +137,21 @@ class ProcessedLink(BaseModel):
         use_enum_values=True
     )
     
+    @field_validator("original", "resolved", "final", mode="before")
+    @classmethod
+    def reuse_parsed_urls(cls, v):
+        """Share parsed URLs between links pointing at the same address.
+        
+        Args:
+            v: URL field value
+            
+        Returns:
+            Cached HttpUrl for URL strings seen before, otherwise the value
+        """
+        # Reason: The same redirect targets and affiliate URLs recur across
+        # items, and HttpUrl instances are immutable, so they can be shared
+        return _parse_http_url(v)
+    
     @field_validator("network")
     @classmethod
     def validate_network(cls, v):
@@ -51,10 +163,12 @@ class ProcessedLink(BaseModel):
         Returns:
             Validated network name
         """
-        allowed_networks = ["amazon", "clickbank", "shareasale", "unknown"]
-        if v.lower() not in allowed_networks:
+        network = v.lower()
+        if network not in _VALID_NETWORKS:
             return "unknown"
-        return v.lower()
+        # Reason: lower() returns a fresh string per link; interning makes
+        # every link share one object per network name
+        return sys.intern(network)
 
 
 class FeedItem(BaseModel):
@@ -92,11 +206,13 @@ class FeedItem(BaseModel):
     
     @field_validator("title")
     @classmethod
-    def validate_title(cls, v):
+    def validate_title(cls, v, info: ValidationInfo):
         """Validate and clean title field.
         
         Args:
             v: Title string
+            info: Validation info; a CACHED_CONTEXT context marks text that
+                was already cleaned
             
         Returns:
             Cleaned title string
@@ -105,24 +221,25 @@ class FeedItem(BaseModel):
             return "Untitled"
         
         # Clean up common HTML entities and excessive whitespace
-        import html
-        cleaned = html.unescape(v.strip())
+        cleaned = v.strip() if _is_cached(info) else _unescape(v.strip())
         # Replace multiple whitespace with single space
         cleaned = " ".join(cleaned.split())
         
         # Truncate very long titles
-        if len(cleaned) > 200:
-            cleaned = cleaned[:197] + "..."
+        if len(cleaned) > _TITLE_MAX_LENGTH:
+            cleaned = cleaned[:_TITLE_MAX_LENGTH - len(_ELLIPSIS)] + _ELLIPSIS
         
         return cleaned
     
     @field_validator("summary")
     @classmethod
-    def validate_summary(cls, v):
+    def validate_summary(cls, v, info: ValidationInfo):
         """Validate and clean summary field.
         
         Args:
             v: Summary string
+            info: Validation info; a CACHED_CONTEXT context marks text that
+                was already cleaned
             
         Returns:
             Cleaned summary string
@@ -131,13 +248,12 @@ class FeedItem(BaseModel):
             return ""
         
         # Clean up HTML entities and excessive whitespace
-        import html
-        cleaned = html.unescape(v.strip())
+        cleaned = v.strip() if _is_cached(info) else _unescape(v.strip())
         cleaned = " ".join(cleaned.split())
         
         # Truncate very long summaries
-        if len(cleaned) > 500:
-            cleaned = cleaned[:497] + "..."
+        if len(cleaned) > _SUMMARY_MAX_LENGTH:
+            cleaned = cleaned[:_SUMMARY_MAX_LENGTH - len(_ELLIPSIS)] + _ELLIPSIS
         
         return cleaned
     
@@ -150,6 +266,15 @@ class FeedItem(BaseModel):
         """
         return [link for link in self.processed_links if link.is_affiliate]
     
+    @property
+    def affiliate_count(self) -> int:
+        """Get number of affiliate links without building the filtered list.
+        
+        Returns:
+            Number of processed links that are affiliate links
+        """
+        return sum(1 for link in self.processed_links if link.is_affiliate)
+    
     @property
     def link_count(self) -> int:
         """Get total number of processed links.
@@ -231,7 +356,7 @@ class ScrapingResult(BaseModel):
         Returns:
             Total count of affiliate links
         """
-        return sum(len(item.affiliate_links) for item in self.items)
+        return sum(item.affiliate_count for item in self.items)
 
 
 class ScrapingStats(BaseModel):
@@ -289,4 +414,37 @@ class ScrapingStats(BaseModel):
         """
         if self.total_links_processed == 0:
             return 0.0
-        return (self.total_affiliate_links / self.total_links_processed) * 100.0
\ No newline at end of file
+        return (self.total_affiliate_links / self.total_links_processed) * 100.0
+
+
+class CachedFeed(BaseModel):
+    """Cached state of a feed from its previous successful scrape.
+    
+    Holds the HTTP validators used for conditional requests, a hash of the
+    feed body, and the items that were produced from it.
+    """
+    
+    etag: Optional[str] = Field(
+        None,
+        description="ETag response header of the cached feed"
+    )
+    last_modified: Optional[str] = Field(
+        None,
+        description="Last-Modified response header of the cached feed"
+    )
+    content_hash: Optional[str] = Field(
+        None,
+        description="SHA-256 hex digest of the cached feed body"
+    )
+    watermark: Optional[datetime] = Field(
+        None,
+        description="Newest entry publication date (UTC) seen in the cached feed"
+    )
+    affiliate_fingerprint: Optional[str] = Field(
+        None,
+        description="ScraperConfig.affiliate_fingerprint the cached items were tagged with"
+    )
+    items: List[FeedItem] = Field(
+        default_factory=list,
+        description="Feed items produced from the cached feed"
+    )
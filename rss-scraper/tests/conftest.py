@@ -0,0 +1,35 @@
+"""Shared fixtures for the scraper test suite."""
+
+import pytest
+from pydantic_settings import SettingsConfigDict
+
+from scraper.config import ScraperConfig
+from scraper.link_processor import LinkProcessor
+
+
+class FrozenScraperConfig(ScraperConfig):
+    """Read-only configuration for fixtures shared across tests.
+    
+    Production code never mutates its configuration; freezing the shared
+    instance makes a test that tries to fail loudly instead of leaking its
+    change into the rest of the module.
+    """
+    
+    model_config = SettingsConfigDict(frozen=True)
+
+
+@pytest.fixture(scope="module")
+def test_config():
+    """Create test configuration shared by the tests of a module."""
+    return FrozenScraperConfig.trusted(
+        rss_sources=["https://example.com/feed"],
+        amazon_tag_us="test-20",
+        amazon_tag_ca="testca-20",
+        use_playwright=False
+    )
+
+
+@pytest.fixture(scope="module")
+def link_processor(test_config):
+    """Create LinkProcessor instance shared by the tests of a module."""
+    return LinkProcessor(test_config)
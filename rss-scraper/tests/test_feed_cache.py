@@ -0,0 +1,113 @@
+"""Tests for the persistent feed cache."""
+
+from scraper.feed_cache import FeedCache
+from scraper.models import FeedItem
+
+
+def make_item(link: str = "https://example.com/deal1") -> FeedItem:
+    """Create a minimal feed item for caching."""
+    return FeedItem(title="Cached Deal", link=link)
+
+
+class TestFeedCache:
+    """Test cases for FeedCache."""
+    
+    def test_load_missing_file(self, tmp_path):
+        """Test that a missing cache file loads as an empty cache."""
+        cache = FeedCache(str(tmp_path / "missing.json"))
+        cache.load()
+        
+        assert cache.get("https://example.com/feed") is None
+        assert cache.conditional_headers("https://example.com/feed") == {}
+    
+    def test_round_trip(self, tmp_path):
+        """Test that saved feeds are restored with validators and items."""
+        path = tmp_path / "cache" / "feed_cache.json"
+        cache = FeedCache(str(path))
+        cache.update(
+            "https://example.com/feed",
+            [make_item()],
+            etag='"abc"',
+            last_modified="Mon, 01 Jan 2024 12:00:00 GMT",
+            content_hash="deadbeef"
+        )
+        cache.save()
+        
+        restored = FeedCache(str(path))
+        restored.load()
+        cached = restored.get("https://example.com/feed")
+        
+        assert cached.content_hash == "deadbeef"
+        assert [str(item.link) for item in cached.items] == ["https://example.com/deal1"]
+        assert restored.conditional_headers("https://example.com/feed") == {
+            'If-None-Match': '"abc"',
+            'If-Modified-Since': "Mon, 01 Jan 2024 12:00:00 GMT",
+        }
+    
+    def test_round_trip_keeps_escaped_text(self, tmp_path):
+        """Test that entity-like text in cached items isn't unescaped again."""
+        path = tmp_path / "feed_cache.json"
+        cache = FeedCache(str(path))
+        item = FeedItem(
+            title="Use &amp;lt;b&amp;gt; tags",
+            link="https://example.com/deal1",
+            summary="Escape &amp;amp; as &amp;amp;amp;"
+        )
+        assert item.title == "Use &lt;b&gt; tags"
+        cache.update("https://example.com/feed", [item])
+        cache.save()
+        
+        restored = FeedCache(str(path))
+        restored.load()
+        cached_item = restored.get("https://example.com/feed").items[0]
+        
+        assert cached_item.title == "Use &lt;b&gt; tags"
+        assert cached_item.summary == "Escape &amp; as &amp;amp;"
+    
+    def test_save_replaces_file_atomically(self, tmp_path):
+        """Test that saving swaps in a complete file and leaves no temp file."""
+        path = tmp_path / "feed_cache.json"
+        path.write_text("{}")
+        cache = FeedCache(str(path))
+        cache.update("https://example.com/feed", [make_item()])
+        cache.save()
+        
+        assert [p.name for p in tmp_path.iterdir()] == ["feed_cache.json"]
+        restored = FeedCache(str(path))
+        restored.load()
+        assert restored.get("https://example.com/feed") is not None
+    
+    def test_save_skipped_when_unchanged(self, tmp_path):
+        """Test that an unchanged cache is not written."""
+        path = tmp_path / "feed_cache.json"
+        cache = FeedCache(str(path))
+        cache.load()
+        cache.save()
+        
+        assert not path.exists()
+    
+    def test_corrupt_file_ignored(self, tmp_path):
+        """Test that an unreadable cache file is treated as empty."""
+        path = tmp_path / "feed_cache.json"
+        path.write_text("{not json")
+        
+        cache = FeedCache(str(path))
+        cache.load()
+        
+        assert cache.get("https://example.com/feed") is None
+    
+    def test_other_affiliate_settings_ignored(self, tmp_path):
+        """Test that feeds cached under other affiliate settings are not reused."""
+        path = tmp_path / "feed_cache.json"
+        cache = FeedCache(str(path), affiliate_fingerprint="old")
+        cache.update("https://example.com/feed", [make_item()], etag='"abc"')
+        cache.save()
+        
+        same = FeedCache(str(path), affiliate_fingerprint="old")
+        same.load()
+        changed = FeedCache(str(path), affiliate_fingerprint="new")
+        changed.load()
+        
+        assert same.get("https://example.com/feed") is not None
+        assert changed.get("https://example.com/feed") is None
+        assert changed.conditional_headers("https://example.com/feed") == {}
@@ -0,0 +1,172 @@
+"""Tests for feed sniffing and parsing."""
+
+import feedparser
+
+from scraper.feed_parser import looks_like_feed, parse_feed, parse_feed_date, parse_feed_fast
+
+
+SAMPLE_RSS_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+  <channel>
+    <title>Test Feed</title>
+    <link>https://example.com</link>
+    <item>
+      <title>Test Deal: Amazing Product</title>
+      <link>https://example.com/deal1</link>
+      <description>Check out this amazing product with great deals!</description>
+      <pubDate>Mon, 01 Jan 2024 12:00:00 GMT</pubDate>
+    </item>
+    <item>
+      <title>Another Great Deal</title>
+      <link>https://example.com/deal2</link>
+      <description>Another fantastic deal you won't want to miss!</description>
+      <pubDate>Tue, 02 Jan 2024 12:00:00 GMT</pubDate>
+    </item>
+  </channel>
+</rss>"""
+
+# RSS feed declaring the extension namespaces that share core local names;
+# format with the inner XML of a single item
+MEDIA_RSS_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/"
+     xmlns:content="http://purl.org/rss/1.0/modules/content/">
+  <channel>
+    <title>Media Feed</title>
+    <item>{item}
+    </item>
+  </channel>
+</rss>"""
+
+
+class TestLooksLikeFeed:
+    """Test cases for the response body sniffing check."""
+    
+    def test_feeds_accepted(self):
+        """Test that feeds without an XML declaration and UTF-16 feeds are accepted."""
+        assert looks_like_feed(SAMPLE_RSS_FEED.encode('utf-8'))
+        assert looks_like_feed(b"\n  <rss version=\"2.0\"><channel></channel></rss>")
+        assert looks_like_feed('<?xml version="1.0"?><feed/>'.encode('utf-16'))
+        
+        # Root element past the sniffed prefix, after a BOM or whitespace
+        prolog = b"<!-- " + b"x" * 2000 + b" -->"
+        assert looks_like_feed(b"\xef\xbb\xbf" + prolog + b"<rss/>")
+        assert looks_like_feed(b"\r\n  " + prolog + b"<rss/>")
+    
+    def test_non_feeds_rejected(self):
+        """Test that HTML pages and non-markup bodies are rejected."""
+        assert not looks_like_feed(b"<!DOCTYPE html><html><body>Error</body></html>")
+        assert not looks_like_feed(b'{"error": "not found"}')
+        assert not looks_like_feed(b"\xef\xbb\xbf\n  <HTML><body>" + b"x" * 2000)
+
+
+class TestParseFeed:
+    """Test cases for parse_feed."""
+    
+    def test_fast_path_and_fallback(self):
+        """Test that well-formed feeds use the fast parser and others feedparser."""
+        feed = parse_feed(SAMPLE_RSS_FEED.encode('utf-8'))
+        malformed = parse_feed(b"<rss><channel><item>&nbsp;")
+        
+        assert feed.version == "rss20"
+        assert len(feed.entries) == 2
+        assert malformed.bozo
+        # Reason: The exception is stringified so it pickles back from workers
+        assert isinstance(malformed.bozo_exception, str)
+
+
+class TestParseFeedFast:
+    """Test cases for the streaming feed parser."""
+    
+    def test_rss_matches_feedparser(self):
+        """Test that RSS entries expose the same fields as feedparser's."""
+        fast = parse_feed_fast(SAMPLE_RSS_FEED.encode('utf-8'))
+        reference = feedparser.parse(SAMPLE_RSS_FEED.encode('utf-8'))
+        
+        assert fast.version == reference.version == "rss20"
+        assert not fast.bozo
+        for entry, expected in zip(fast.entries, reference.entries):
+            assert entry.title == expected.title
+            assert entry.link == expected.link
+            assert entry.summary == expected.summary
+            assert entry.published_parsed == expected.published_parsed
+    
+    def test_atom_entries(self):
+        """Test Atom links, content and date precedence."""
+        atom = b"""<?xml version="1.0"?>
+        <feed xmlns="http://www.w3.org/2005/Atom">
+          <title>Atom Feed</title>
+          <entry>
+            <title>Atom Deal</title>
+            <link rel="self" href="https://example.com/self"/>
+            <link href="https://example.com/atom-deal"/>
+            <updated>2024-01-03T00:00:00Z</updated>
+            <published>2024-01-02T10:00:00+01:00</published>
+            <content type="html">&lt;p&gt;Full text&lt;/p&gt;</content>
+          </entry>
+        </feed>"""
+        
+        feed = parse_feed_fast(atom)
+        
+        assert feed.version == "atom10"
+        entry = feed.entries[0]
+        assert entry.link == "https://example.com/atom-deal"
+        assert entry.content[0]["value"] == "<p>Full text</p>"
+        assert entry.published_parsed[:6] == (2024, 1, 2, 9, 0, 0)
+    
+    def test_extension_title_ignored(self):
+        """Test that media:title doesn't replace an item's own title."""
+        rss = MEDIA_RSS_FEED.format(item="""
+            <title>Real Deal Title</title>
+            <link>https://example.com/deal</link>
+            <media:title>Thumbnail caption</media:title>""").encode('utf-8')
+        
+        entry = parse_feed_fast(rss)["entries"][0]
+        
+        assert entry.title == "Real Deal Title"
+        assert entry.title == feedparser.parse(rss).entries[0].title
+    
+    def test_empty_media_content_keeps_encoded_content(self):
+        """Test that an empty media:content doesn't overwrite content:encoded."""
+        rss = MEDIA_RSS_FEED.format(item="""
+            <title>Deal</title>
+            <link>https://example.com/deal</link>
+            <content:encoded><![CDATA[<p>Full <a href="https://amazon.com/dp/B1">text</a></p>]]></content:encoded>
+            <media:content url="https://example.com/image.jpg"/>""").encode('utf-8')
+        
+        entry = parse_feed_fast(rss)["entries"][0]
+        
+        assert entry.content[0]["value"] == '<p>Full <a href="https://amazon.com/dp/B1">text</a></p>'
+    
+    def test_permalink_guid_used_without_link(self):
+        """Test that a permalink guid stands in for a missing link, as in feedparser."""
+        rss = MEDIA_RSS_FEED.format(item="""
+            <title>Guid Deal</title>
+            <guid>https://example.com/guid-deal</guid>
+        </item>
+        <item>
+            <title>Opaque Guid Deal</title>
+            <guid isPermaLink="false">deal-1234</guid>""").encode('utf-8')
+        
+        permalink, opaque = parse_feed_fast(rss)["entries"]
+        reference = feedparser.parse(rss).entries
+        
+        assert permalink.link == reference[0].link == "https://example.com/guid-deal"
+        assert not hasattr(opaque, "link")
+        assert "link" not in reference[1]
+    
+    def test_feed_dates_parsed_once(self):
+        """Test that repeated date strings are served from the date cache."""
+        value = "Wed, 03 Jan 2024 08:30:00 +0100"
+        first = parse_feed_date(value)
+        hits = parse_feed_date.cache_info().hits
+        
+        assert parse_feed_date(value) is first
+        assert parse_feed_date.cache_info().hits == hits + 1
+        assert first[:6] == (2024, 1, 3, 7, 30, 0)
+        assert parse_feed_date("not a date") is None
+    
+    def test_unsupported_documents_fall_back(self):
+        """Test that malformed or non-feed documents return None."""
+        assert parse_feed_fast(b"<invalid>xml content</invalid>") is None
+        assert parse_feed_fast(b"<rss><channel><item><title>&nbsp;</title></item></channel></rss>") is None
+        assert parse_feed_fast(b"not xml at all") is None
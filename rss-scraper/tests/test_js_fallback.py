@@ -1,16 +1,30 @@
 """Tests for JavaScript fallback using Playwright."""
 
+import os
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 from unittest.mock import AsyncMock, patch
 
-from scraper.js_fallback import JavaScriptRenderer, fetch_with_js_fallback, fetch_js_content
+from scraper.js_fallback import (
+    JavaScriptRenderer,
+    _block_resource,
+    close_renderer,
+    fetch_js_content,
+    fetch_with_js_fallback,
+)
 from scraper.config import ScraperConfig
 
+# Static markup long enough that only an indicator can trigger rendering
+STATIC_PADDING = "<p>" + "Regular article text. " * 30 + "</p>"
+
 
 @pytest.fixture
 def test_config_js_enabled():
     """Create test configuration with Playwright enabled."""
-    return ScraperConfig(
+    return ScraperConfig.trusted(
         rss_sources=["https://example.com/feed"],
         use_playwright=True
     )
@@ -19,12 +33,19 @@ def test_config_js_enabled():
 @pytest.fixture  
 def test_config_js_disabled():
     """Create test configuration with Playwright disabled."""
-    return ScraperConfig(
+    return ScraperConfig.trusted(
         rss_sources=["https://example.com/feed"],
         use_playwright=False
     )
 
 
+@pytest.fixture(autouse=True)
+def reset_shared_renderer(monkeypatch):
+    """Start each test without a shared renderer left over from another test."""
+    monkeypatch.setattr('scraper.js_fallback._renderer', None)
+    monkeypatch.setattr('scraper.js_fallback._renderer_stack', None)
+
+
 class TestJavaScriptRenderer:
     """Test cases for JavaScriptRenderer class."""
     
@@ -35,18 +56,41 @@ class TestJavaScriptRenderer:
         assert renderer.config == test_config_js_enabled
         assert renderer.browser is None
         assert renderer.context is None
+        assert not hasattr(renderer, '__dict__')
     
-    @pytest.mark.asyncio
     async def test_context_manager_disabled(self, test_config_js_disabled):
         """Test context manager when Playwright is disabled."""
         async with JavaScriptRenderer(test_config_js_disabled) as renderer:
             assert renderer.browser is None
             assert renderer.context is None
     
-    @pytest.mark.asyncio
+    def test_disabled_renderer_does_not_import_playwright(self):
+        """Test that the disabled path never loads the Playwright package."""
+        script = (
+            "import asyncio, sys\n"
+            "from scraper.config import ScraperConfig\n"
+            "from scraper.js_fallback import JavaScriptRenderer, fetch_with_js_fallback\n"
+            "config = ScraperConfig(rss_sources=['https://example.com/feed'], use_playwright=False)\n"
+            "async def run():\n"
+            "    async with JavaScriptRenderer(config):\n"
+            "        pass\n"
+            "    await fetch_with_js_fallback('https://example.com', config, 'static')\n"
+            "asyncio.run(run())\n"
+            "print('playwright' in sys.modules)\n"
+        )
+        project_root = Path(__file__).resolve().parent.parent
+        env = {**os.environ, "PYTHONPATH": str(project_root)}
+        
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True, text=True, env=env, cwd=project_root / "tests", check=True
+        )
+        
+        assert result.stdout.strip() == "False"
+    
     async def test_context_manager_enabled(self, test_config_js_enabled):
         """Test context manager when Playwright is enabled."""
-        with patch('scraper.js_fallback.async_playwright') as mock_playwright:
+        with patch('playwright.async_api.async_playwright') as mock_playwright:
             # Mock Playwright components
             mock_playwright_instance = AsyncMock()
             mock_browser = AsyncMock()
@@ -59,13 +103,106 @@ class TestJavaScriptRenderer:
             async with JavaScriptRenderer(test_config_js_enabled) as renderer:
                 assert renderer.browser == mock_browser
                 assert renderer.context == mock_context
+                # Resource blocking is registered once on the context
+                mock_context.route.assert_called_once()
             
             # Verify cleanup was called
             mock_context.close.assert_called_once()
             mock_browser.close.assert_called_once()
             mock_playwright_instance.stop.assert_called_once()
     
-    @pytest.mark.asyncio
+    async def test_context_manager_shared_browser(self, test_config_js_enabled):
+        """Test that an injected browser is reused and left running on exit."""
+        with patch('playwright.async_api.async_playwright') as mock_playwright:
+            shared_browser = AsyncMock()
+            contexts = [AsyncMock(), AsyncMock()]
+            shared_browser.new_context = AsyncMock(side_effect=contexts)
+            
+            for context in contexts:
+                async with JavaScriptRenderer(test_config_js_enabled, browser=shared_browser) as renderer:
+                    assert renderer.browser is shared_browser
+                    assert renderer.context is context
+                context.close.assert_called_once()
+            
+            mock_playwright.assert_not_called()
+            assert shared_browser.new_context.call_count == 2
+            shared_browser.close.assert_not_called()
+    
+    async def test_pool_reuse(self, test_config_js_enabled):
+        """Test that concurrent renders share at most pool_size contexts."""
+        import asyncio
+        
+        test_config_js_enabled.playwright_pool_size = 2
+        rendered = "<html><body>" + "<p>Rendered product content</p>" * 10 + "</body></html>"
+        active = 0
+        peak = 0
+        pages = []
+        
+        async def new_page():
+            page = AsyncMock()
+            
+            async def content():
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+                return rendered
+            
+            page.content = content
+            pages.append(page)
+            return page
+        
+        contexts = []
+        
+        def make_context():
+            context = AsyncMock()
+            context.new_page = new_page
+            contexts.append(context)
+            return context
+        
+        shared_browser = AsyncMock()
+        shared_browser.new_context = AsyncMock(side_effect=lambda **kwargs: make_context())
+        
+        async with JavaScriptRenderer(test_config_js_enabled, browser=shared_browser) as renderer:
+            results = await asyncio.gather(*[
+                renderer.fetch_js_content(f"https://example.com/{i}") for i in range(5)
+            ])
+        
+        assert results == [rendered] * 5
+        assert shared_browser.new_context.call_count == 2
+        assert peak == 2
+        # Each context keeps one page that is navigated to every later URL
+        assert len(pages) == 2
+        assert sum(page.goto.call_count for page in pages) == 5
+        # Resource blocking is registered per context, not per page
+        assert len(contexts) == 2
+        for context in contexts:
+            context.route.assert_called_once_with("**/*", _block_resource)
+    
+    async def test_block_resource(self):
+        """Test that heavy resources and trackers are aborted and pages continue."""
+        def make_route(resource_type, url):
+            route = AsyncMock()
+            route.request.resource_type = resource_type
+            route.request.url = url
+            return route
+        
+        for resource_type, url in [
+            ("image", "https://example.com/product.webp"),
+            ("font", "https://example.com/font"),
+            ("script", "https://www.googletagmanager.com/gtm.js"),
+        ]:
+            route = make_route(resource_type, url)
+            await _block_resource(route)
+            route.abort.assert_called_once()
+            route.continue_.assert_not_called()
+        
+        route = make_route("script", "https://example.com/app.js")
+        await _block_resource(route)
+        route.continue_.assert_called_once()
+        route.abort.assert_not_called()
+    
     async def test_fetch_js_content_disabled(self, test_config_js_disabled):
         """Test fetch_js_content when Playwright is disabled."""
         renderer = JavaScriptRenderer(test_config_js_disabled)
@@ -73,7 +210,6 @@ class TestJavaScriptRenderer:
         result = await renderer.fetch_js_content("https://example.com")
         assert result is None
     
-    @pytest.mark.asyncio
     async def test_fetch_js_content_not_initialized(self, test_config_js_enabled):
         """Test fetch_js_content when browser is not initialized."""
         renderer = JavaScriptRenderer(test_config_js_enabled)
@@ -81,10 +217,10 @@ class TestJavaScriptRenderer:
         result = await renderer.fetch_js_content("https://example.com")
         assert result is None
     
-    @pytest.mark.asyncio
     async def test_fetch_js_content_success(self, test_config_js_enabled):
-        """Test successful JavaScript content fetching."""
+        """Test successful JavaScript content fetching reusing one page."""
         renderer = JavaScriptRenderer(test_config_js_enabled)
+        rendered = "<html><body>" + "<p>Rendered content</p>" * 10 + "</body></html>"
         
         # Mock browser and page
         mock_page = AsyncMock()
@@ -95,21 +231,116 @@ class TestJavaScriptRenderer:
         mock_page.route = AsyncMock()
         mock_page.goto = AsyncMock()
         mock_page.wait_for_function = AsyncMock()
-        mock_page.content = AsyncMock(return_value="<html><body>Rendered content</body></html>")
+        mock_page.content = AsyncMock(return_value=rendered)
         mock_page.close = AsyncMock()
         
         renderer.browser = mock_browser
         renderer.context = mock_context
         
+        assert await renderer.fetch_js_content("https://example.com/1") == rendered
+        assert await renderer.fetch_js_content("https://example.com/2") == rendered
+        
+        mock_context.new_page.assert_called_once()
+        assert [call.args[0] for call in mock_page.goto.call_args_list] == ["https://example.com/1", "https://example.com/2"]
+        assert mock_page.wait_for_function.call_count == 2
+        assert mock_page.content.call_count == 2
+        mock_page.close.assert_not_called()
+    
+    async def test_fetch_js_content_replaces_failed_page(self, test_config_js_enabled):
+        """Test that a page whose render raised is closed and replaced."""
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+        
+        renderer = JavaScriptRenderer(test_config_js_enabled)
+        rendered = "<html><body>" + "<p>Rendered content</p>" * 10 + "</body></html>"
+        
+        failed_page = AsyncMock()
+        failed_page.goto = AsyncMock(side_effect=PlaywrightTimeoutError("Timeout"))
+        fresh_page = AsyncMock()
+        fresh_page.content = AsyncMock(return_value=rendered)
+        mock_context = AsyncMock()
+        mock_context.new_page = AsyncMock(side_effect=[failed_page, fresh_page])
+        
+        renderer.browser = AsyncMock()
+        renderer.context = mock_context
+        
+        assert await renderer.fetch_js_content("https://example.com/1") is None
+        assert await renderer.fetch_js_content("https://example.com/2") == rendered
+        
+        failed_page.close.assert_called_once()
+        fresh_page.close.assert_not_called()
+        assert mock_context.new_page.call_count == 2
+    
+    async def test_fetch_js_content_links_only(self, test_config_js_enabled):
+        """Test that links-only mode extracts anchors in the browser."""
+        from lxml import html as lxml_html
+        
+        test_config_js_enabled.playwright_links_only = True
+        renderer = JavaScriptRenderer(test_config_js_enabled)
+        hrefs = ["https://amazon.com/dp/B123", "https://example.com/a?x=1&y=\"2\""]
+        
+        mock_page = AsyncMock()
+        mock_context = AsyncMock()
+        mock_context.new_page = AsyncMock(return_value=mock_page)
+        mock_page.evaluate = AsyncMock(return_value=hrefs)
+        
+        renderer.browser = AsyncMock()
+        renderer.context = mock_context
+        
         result = await renderer.fetch_js_content("https://example.com")
         
-        assert result == "<html><body>Rendered content</body></html>"
-        mock_page.goto.assert_called_once()
-        mock_page.wait_for_function.assert_called_once()
-        mock_page.content.assert_called_once()
-        mock_page.close.assert_called_once()
+        assert [a.get('href') for a in lxml_html.fromstring(result).iter('a')] == hrefs
+        mock_page.evaluate.assert_called_once()
+        mock_page.content.assert_not_called()
+        
+        mock_page.evaluate = AsyncMock(return_value=[])
+        assert await renderer.fetch_js_content("https://example.com") is None
+    
+    async def test_fetch_js_content_ready_selector(self, test_config_js_enabled):
+        """Test that a ready selector replaces the generic load-state wait."""
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+        
+        renderer = JavaScriptRenderer(test_config_js_enabled)
+        rendered = "<html><body>" + "<p>Rendered product content</p>" * 10 + "</body></html>"
+        
+        mock_page = AsyncMock()
+        mock_context = AsyncMock()
+        mock_context.new_page = AsyncMock(return_value=mock_page)
+        # A slow selector should not discard the content that did render
+        mock_page.wait_for_selector = AsyncMock(side_effect=PlaywrightTimeoutError("Timeout"))
+        mock_page.content = AsyncMock(return_value=rendered)
+        
+        renderer.browser = AsyncMock()
+        renderer.context = mock_context
+        
+        result = await renderer.fetch_js_content("https://example.com", ready_selector="[data-testid=price]")
+        
+        assert result == rendered
+        mock_page.wait_for_selector.assert_called_once()
+        assert mock_page.wait_for_selector.call_args[0][0] == "[data-testid=price]"
+        mock_page.wait_for_load_state.assert_not_called()
+    
+    async def test_fetch_js_content_never_waits_for_networkidle(self, test_config_js_enabled):
+        """Test that configured readiness replaces networkidle waits."""
+        test_config_js_enabled.playwright_ready_selector = "main, article"
+        test_config_js_enabled.playwright_ready_timeout_ms = 500
+        renderer = JavaScriptRenderer(test_config_js_enabled)
+        rendered = "<html><body>" + "<p>Rendered product content</p>" * 10 + "</body></html>"
+        
+        mock_page = AsyncMock()
+        mock_context = AsyncMock()
+        mock_context.new_page = AsyncMock(return_value=mock_page)
+        mock_page.content = AsyncMock(return_value=rendered)
+        
+        renderer.browser = AsyncMock()
+        renderer.context = mock_context
+        
+        assert await renderer.fetch_js_content("https://example.com") == rendered
+        
+        assert mock_page.goto.call_args.kwargs['wait_until'] == 'domcontentloaded'
+        mock_page.wait_for_selector.assert_called_once_with("main, article", state='attached', timeout=500)
+        mock_page.wait_for_function.assert_not_called()
+        mock_page.wait_for_load_state.assert_not_called()
     
-    @pytest.mark.asyncio
     async def test_fetch_js_content_timeout(self, test_config_js_enabled):
         """Test JavaScript content fetching with timeout."""
         from playwright.async_api import TimeoutError as PlaywrightTimeoutError
@@ -134,7 +365,6 @@ class TestJavaScriptRenderer:
         assert result is None
         mock_page.close.assert_called_once()
     
-    @pytest.mark.asyncio
     async def test_fetch_js_content_empty_response(self, test_config_js_enabled):
         """Test JavaScript content fetching with empty response."""
         renderer = JavaScriptRenderer(test_config_js_enabled)
@@ -158,8 +388,7 @@ class TestJavaScriptRenderer:
         
         assert result is None
     
-    @pytest.mark.asyncio
-    async def test_is_js_required(self, test_config_js_enabled):
+    def test_is_js_required(self, test_config_js_enabled):
         """Test JavaScript requirement detection."""
         renderer = JavaScriptRenderer(test_config_js_enabled)
         
@@ -174,7 +403,7 @@ class TestJavaScriptRenderer:
         ]
         
         for content in js_indicators:
-            assert await renderer.is_js_required("https://example.com", content) == True
+            assert renderer.is_js_required("https://example.com", content) == True
         
         # Test normal content
         normal_content = """
@@ -186,17 +415,16 @@ class TestJavaScriptRenderer:
         </body>
         </html>
         """
-        assert await renderer.is_js_required("https://example.com", normal_content) == False
+        assert renderer.is_js_required("https://example.com", normal_content) == False
         
         # Test empty content
-        assert await renderer.is_js_required("https://example.com", "") == True
-        assert await renderer.is_js_required("https://example.com", None) == True
+        assert renderer.is_js_required("https://example.com", "") == True
+        assert renderer.is_js_required("https://example.com", None) == True
         
         # Test very short content
         short_content = "<p>Hi</p>"
-        assert await renderer.is_js_required("https://example.com", short_content) == True
+        assert renderer.is_js_required("https://example.com", short_content) == True
     
-    @pytest.mark.asyncio
     async def test_cleanup_browser_error_handling(self, test_config_js_enabled):
         """Test error handling during browser cleanup."""
         renderer = JavaScriptRenderer(test_config_js_enabled)
@@ -221,12 +449,40 @@ class TestJavaScriptRenderer:
         mock_context.close.assert_called_once()
         mock_browser.close.assert_called_once()
         mock_playwright.stop.assert_called_once()
+    
+    async def test_cleanup_closes_pooled_contexts_concurrently(self, test_config_js_enabled):
+        """Test that pooled contexts close together before the browser closes."""
+        import asyncio
+        
+        events = []
+        
+        def make_context(name):
+            context = AsyncMock()
+            
+            async def close():
+                events.append(f"{name} start")
+                await asyncio.sleep(0)
+                events.append(f"{name} end")
+            
+            context.close = close
+            return context
+        
+        renderer = JavaScriptRenderer(test_config_js_enabled)
+        renderer._contexts = [make_context("a"), make_context("b")]
+        renderer.context = renderer._contexts[0]
+        renderer.browser = AsyncMock()
+        renderer.browser.close = AsyncMock(side_effect=lambda: events.append("browser"))
+        
+        await renderer._cleanup_browser()
+        
+        assert events == ["a start", "b start", "a end", "b end", "browser"]
+        assert renderer.context is None
+        assert renderer.browser is None
 
 
 class TestConvenienceFunctions:
     """Test convenience functions for JavaScript rendering."""
     
-    @pytest.mark.asyncio
     async def test_fetch_with_js_fallback_disabled(self, test_config_js_disabled):
         """Test fetch_with_js_fallback when Playwright is disabled."""
         static_content = "<html><body>Static content</body></html>"
@@ -239,9 +495,8 @@ class TestConvenienceFunctions:
         
         assert result == static_content
     
-    @pytest.mark.asyncio
     async def test_fetch_with_js_fallback_static_sufficient(self, test_config_js_enabled):
-        """Test fetch_with_js_fallback when static content is sufficient."""
+        """Test that sufficient static content is returned without starting a renderer."""
         static_content = """
         <html>
         <body>
@@ -250,13 +505,10 @@ class TestConvenienceFunctions:
             <div>More content here to make it substantial.</div>
         </body>
         </html>
-        """
+        """ + STATIC_PADDING
         
         with patch('scraper.js_fallback.JavaScriptRenderer') as MockRenderer:
-            mock_renderer = AsyncMock()
-            mock_renderer.is_js_required = AsyncMock(return_value=False)
-            MockRenderer.return_value.__aenter__ = AsyncMock(return_value=mock_renderer)
-            MockRenderer.return_value.__aexit__ = AsyncMock(return_value=None)
+            MockRenderer.return_value.__aenter__ = AsyncMock()
             
             result = await fetch_with_js_fallback(
                 "https://example.com",
@@ -265,9 +517,9 @@ class TestConvenienceFunctions:
             )
             
             assert result == static_content
-            mock_renderer.is_js_required.assert_called_once()
+            MockRenderer.assert_not_called()
+            MockRenderer.return_value.__aenter__.assert_not_called()
     
-    @pytest.mark.asyncio
     async def test_fetch_with_js_fallback_js_needed(self, test_config_js_enabled):
         """Test fetch_with_js_fallback when JavaScript rendering is needed."""
         static_content = '<div id="root"></div>'  # Needs JS
@@ -275,7 +527,6 @@ class TestConvenienceFunctions:
         
         with patch('scraper.js_fallback.JavaScriptRenderer') as MockRenderer:
             mock_renderer = AsyncMock()
-            mock_renderer.is_js_required = AsyncMock(return_value=True)
             mock_renderer.fetch_js_content = AsyncMock(return_value=js_content)
             MockRenderer.return_value.__aenter__ = AsyncMock(return_value=mock_renderer)
             MockRenderer.return_value.__aexit__ = AsyncMock(return_value=None)
@@ -289,14 +540,12 @@ class TestConvenienceFunctions:
             assert result == js_content
             mock_renderer.fetch_js_content.assert_called_once()
     
-    @pytest.mark.asyncio
     async def test_fetch_with_js_fallback_js_fails(self, test_config_js_enabled):
         """Test fetch_with_js_fallback when JavaScript rendering fails."""
         static_content = '<div id="root"></div>'  # Needs JS
         
         with patch('scraper.js_fallback.JavaScriptRenderer') as MockRenderer:
             mock_renderer = AsyncMock()
-            mock_renderer.is_js_required = AsyncMock(return_value=True)
             mock_renderer.fetch_js_content = AsyncMock(return_value=None)  # JS failed
             MockRenderer.return_value.__aenter__ = AsyncMock(return_value=mock_renderer)
             MockRenderer.return_value.__aexit__ = AsyncMock(return_value=None)
@@ -310,7 +559,6 @@ class TestConvenienceFunctions:
             # Should fallback to static content
             assert result == static_content
     
-    @pytest.mark.asyncio
     async def test_fetch_with_js_fallback_no_static_content(self, test_config_js_enabled):
         """Test fetch_with_js_fallback without static content."""
         js_content = '<html><body>Rendered by JavaScript</body></html>'
@@ -329,7 +577,6 @@ class TestConvenienceFunctions:
             assert result == js_content
             mock_renderer.fetch_js_content.assert_called_once()
     
-    @pytest.mark.asyncio
     async def test_fetch_with_js_fallback_everything_fails(self, test_config_js_enabled):
         """Test fetch_with_js_fallback when everything fails."""
         with patch('scraper.js_fallback.JavaScriptRenderer') as MockRenderer:
@@ -346,7 +593,26 @@ class TestConvenienceFunctions:
             
             assert result is None
     
-    @pytest.mark.asyncio
+    async def test_fetch_with_js_fallback_reuses_renderer(self, test_config_js_enabled):
+        """Test that the browser is started once and shared across calls."""
+        js_content = '<html><body>Rendered by JavaScript</body></html>'
+        
+        with patch('scraper.js_fallback.JavaScriptRenderer') as MockRenderer:
+            mock_renderer = AsyncMock()
+            mock_renderer.fetch_js_content = AsyncMock(return_value=js_content)
+            MockRenderer.return_value.__aenter__ = AsyncMock(return_value=mock_renderer)
+            MockRenderer.return_value.__aexit__ = AsyncMock(return_value=None)
+            
+            await fetch_with_js_fallback("https://example.com/1", test_config_js_enabled)
+            await fetch_with_js_fallback("https://example.com/2", test_config_js_enabled)
+            
+            MockRenderer.assert_called_once()
+            assert mock_renderer.fetch_js_content.call_count == 2
+            MockRenderer.return_value.__aexit__.assert_not_called()
+            
+            await close_renderer()
+            MockRenderer.return_value.__aexit__.assert_called_once()
+    
     async def test_legacy_fetch_js_content(self, test_config_js_enabled):
         """Test legacy compatibility function."""
         js_content = '<html><body>Legacy content</body></html>'
@@ -359,7 +625,6 @@ class TestConvenienceFunctions:
             assert result == js_content
             mock_fetch.assert_called_once_with("https://example.com", test_config_js_enabled)
     
-    @pytest.mark.asyncio
     async def test_legacy_fetch_js_content_failure(self, test_config_js_enabled):
         """Test legacy compatibility function when fetching fails."""
         with patch('scraper.js_fallback.fetch_with_js_fallback') as mock_fetch:
@@ -370,58 +635,47 @@ class TestConvenienceFunctions:
             assert result == ""  # Legacy function returns empty string on failure
 
 
+@pytest.fixture
+def renderer(test_config_js_enabled):
+    """Create a renderer shared by the detection cases of a test."""
+    return JavaScriptRenderer(test_config_js_enabled)
+
+
 class TestJavaScriptDetection:
     """Test JavaScript requirement detection logic."""
     
-    @pytest.mark.asyncio
-    async def test_detect_spa_frameworks(self, test_config_js_enabled):
-        """Test detection of Single Page Application frameworks."""
-        renderer = JavaScriptRenderer(test_config_js_enabled)
-        
-        # React
-        react_content = '<div data-reactroot></div>'
-        assert await renderer.is_js_required("https://example.com", react_content) == True
-        
-        # Angular
-        angular_content = '<div ng-app="myApp"></div>'
-        assert await renderer.is_js_required("https://example.com", angular_content) == True
-        
-        # Vue
-        vue_content = '<div vue-app></div>'
-        assert await renderer.is_js_required("https://example.com", vue_content) == True
-        
-        # Backbone
-        backbone_content = '<div backbone-view></div>'
-        assert await renderer.is_js_required("https://example.com", backbone_content) == True
-        
-        # Ember
-        ember_content = '<div ember-app></div>'
-        assert await renderer.is_js_required("https://example.com", ember_content) == True
-    
-    @pytest.mark.asyncio
-    async def test_detect_loading_indicators(self, test_config_js_enabled):
-        """Test detection of loading indicators."""
-        renderer = JavaScriptRenderer(test_config_js_enabled)
-        
-        loading_indicators = [
-            'Loading...',
-            'Please enable JavaScript',
-            'Please wait while the page loads',
-            'Content is loading'
-        ]
-        
-        for indicator in loading_indicators:
-            content = f'<div>{indicator}</div>'
-            assert await renderer.is_js_required("https://example.com", content) == True
+    @pytest.mark.parametrize("content,expected", [
+        # SPA frameworks
+        ('<div data-reactroot></div>' + STATIC_PADDING, True),
+        ('<div ng-app="myApp"></div>' + STATIC_PADDING, True),
+        ('<div vue-app></div>' + STATIC_PADDING, True),
+        ('<div backbone-view></div>' + STATIC_PADDING, True),
+        ('<div ember-app></div>' + STATIC_PADDING, True),
+        # Loading indicators
+        ('<div>Loading...</div>' + STATIC_PADDING, True),
+        ('<div>Please enable JavaScript</div>' + STATIC_PADDING, True),
+        # Short placeholder pages
+        ('<div>Please wait while the page loads</div>', True),
+        ('<div>Content is loading</div>', True),
+        # Case-insensitive matching
+        ('<DIV DATA-REACTROOT></DIV>' + STATIC_PADDING, True),
+        ('<div>LOADING...</div>' + STATIC_PADDING, True),
+        # Regular static page
+        ('<html><body><h1>Normal</h1>' + STATIC_PADDING + '</body></html>', False),
+        # Indicators deep inside a large page are outside the scanned prefix
+        (STATIC_PADDING * 20 + '<div>Loading...</div>', False),
+    ])
+    def test_is_js_required_cases(self, renderer, content, expected):
+        """Test detection of SPA frameworks, loading indicators and static pages."""
+        assert renderer.is_js_required("https://example.com", content) is expected
     
-    @pytest.mark.asyncio
-    async def test_case_insensitive_detection(self, test_config_js_enabled):
-        """Test that JavaScript detection is case-insensitive."""
-        renderer = JavaScriptRenderer(test_config_js_enabled)
+    def test_is_js_required_large_page_scans_only_prefix(self, test_config_js_enabled):
+        """Test that only the configured prefix of a multi-MB page is scanned."""
+        marker_at = 20000
+        page = "x" * marker_at + '<div id="root"></div>'
+        page += "x" * (5 * 1024 * 1024 - len(page))
         
-        # Mixed case indicators should still be detected
-        mixed_case_content = '<DIV DATA-REACTROOT></DIV>'
-        assert await renderer.is_js_required("https://example.com", mixed_case_content) == True
+        assert JavaScriptRenderer(test_config_js_enabled).is_js_required("https://example.com", page) is False
         
-        loading_mixed = '<div>LOADING...</div>'
-        assert await renderer.is_js_required("https://example.com", loading_mixed) == True
\ No newline at end of file
+        test_config_js_enabled.js_scan_chars = 32768
+        assert JavaScriptRenderer(test_config_js_enabled).is_js_required("https://example.com", page) is True
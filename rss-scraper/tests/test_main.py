@@ -1,7 +1,9 @@
 """Tests for main RSS scraper functionality."""
 
+import asyncio
 import json
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 from httpx import AsyncClient
@@ -50,7 +52,7 @@ SAMPLE_HTML_CONTENT = """
 @pytest.fixture
 def test_config():
     """Create test configuration."""
-    return ScraperConfig(
+    return ScraperConfig.trusted(
         rss_sources=["https://example.com/feed"],
         amazon_tag_us="test-20",
         use_playwright=False,
@@ -60,9 +62,35 @@ def test_config():
 
 @pytest.fixture
 def mock_httpx_client():
-    """Create mock HTTP client."""
-    client = AsyncMock(spec=AsyncClient)
-    return client
+    """Create a real HTTP client that serves SAMPLE_RSS_FEED for every request."""
+    return feed_client(httpx.Response(200, text=SAMPLE_RSS_FEED))
+
+
+def feed_client(*responses, requests=None) -> AsyncClient:
+    """Create a real HTTP client that serves responses in order, repeating the last.
+    
+    Responses that are exceptions are raised from the transport instead, and
+    every request is appended to requests when a list is given.
+    """
+    pending = list(responses)
+    
+    def handler(request):
+        if requests is not None:
+            requests.append(request)
+        response = pending.pop(0) if len(pending) > 1 else pending[0]
+        if isinstance(response, Exception):
+            raise response
+        return response
+    
+    return AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def html_client(body: str, content_type: str = 'text/html') -> AsyncClient:
+    """Create a real HTTP client that serves the same body for every request."""
+    def handler(request):
+        return httpx.Response(200, text=body, headers={'content-type': content_type})
+    
+    return AsyncClient(transport=httpx.MockTransport(handler))
 
 
 class TestRSSFeedScraper:
@@ -76,15 +104,8 @@ class TestRSSFeedScraper:
         assert scraper.link_processor is not None
         assert scraper.stats is not None
     
-    @pytest.mark.asyncio
     async def test_scrape_single_feed_success(self, test_config, mock_httpx_client):
         """Test successful RSS feed scraping."""
-        # Mock HTTP response
-        mock_response = MagicMock()
-        mock_response.content = SAMPLE_RSS_FEED.encode('utf-8')
-        mock_response.raise_for_status.return_value = None
-        mock_httpx_client.get.return_value = mock_response
-        
         # Mock content fetching
         scraper = RSSFeedScraper(test_config)
         
@@ -102,16 +123,218 @@ class TestRSSFeedScraper:
         assert result.items[0].title == "Test Deal: Amazing Product"
         assert result.items[1].title == "Another Great Deal"
     
-    @pytest.mark.asyncio
-    async def test_scrape_single_feed_network_error(self, test_config, mock_httpx_client):
+    async def test_scrape_single_feed_bounds_entry_concurrency(self, test_config, mock_httpx_client):
+        """Test that feed entries run concurrently up to max_concurrent_entries."""
+        test_config.max_concurrent_entries = 1
+        scraper = RSSFeedScraper(test_config)
+        active = 0
+        peak = 0
+        
+        async def slow_entry(entry, rss_domain, client):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            if entry.title == "Another Great Deal":
+                raise ValueError("boom")
+            return FeedItem(title=entry.title, link=entry.link)
+        
+        with patch.object(scraper, '_process_feed_entry_unbounded', side_effect=slow_entry):
+            result = await scraper._scrape_single_feed("https://example.com/feed", mock_httpx_client)
+        
+        assert peak == 1
+        assert [item.title for item in result.items] == ["Test Deal: Amazing Product"]
+        assert result.errors == ["Entry processing failed: boom"]
+    
+    async def test_scrape_single_feed_reuses_cached_items(self, test_config, tmp_path):
+        """Test conditional requests and reuse of unchanged feeds and entries."""
+        test_config.feed_cache_json = str(tmp_path / "feed_cache.json")
+        scraper = RSSFeedScraper(test_config)
+        cached_item = FeedItem(title="Cached Deal", link="https://example.com/deal1")
+        scraper.feed_cache.update(
+            "https://example.com/feed",
+            [cached_item],
+            etag='"v1"',
+            content_hash="stale"
+        )
+        
+        requests = []
+        client = feed_client(
+            httpx.Response(304),
+            httpx.Response(200, text=SAMPLE_RSS_FEED, headers={'etag': '"v2"'}),
+            requests=requests
+        )
+        
+        # 304: cached items are returned without parsing the feed
+        result = await scraper._scrape_single_feed("https://example.com/feed", client)
+        
+        assert requests[0].headers['If-None-Match'] == '"v1"'
+        assert 'If-Modified-Since' not in requests[0].headers
+        assert result.items == [cached_item]
+        
+        # 200 with a changed body: only the new entry is processed
+        new_item = FeedItem(title="Another Great Deal", link="https://example.com/deal2")
+        
+        with patch.object(scraper, '_process_feed_entry', return_value=new_item) as mock_process:
+            result = await scraper._scrape_single_feed("https://example.com/feed", client)
+        
+        assert mock_process.call_count == 1
+        assert result.items == [cached_item, new_item]
+        assert scraper.feed_cache.get("https://example.com/feed").etag == '"v2"'
+    
+    async def test_scrape_single_feed_ignores_cache_after_tag_change(self, test_config, tmp_path):
+        """Test that items cached under old affiliate tags are rebuilt."""
+        test_config.feed_cache_json = str(tmp_path / "feed_cache.json")
+        scraper = RSSFeedScraper(test_config)
+        scraper.feed_cache.update(
+            "https://example.com/feed",
+            [FeedItem(title="Cached Deal", link="https://example.com/deal1")],
+            etag='"v1"'
+        )
+        scraper.feed_cache.save()
+        
+        retagged = RSSFeedScraper(ScraperConfig.trusted(
+            rss_sources=["https://example.com/feed"],
+            amazon_tag_us="new-20",
+            use_playwright=False,
+            feed_cache_json=test_config.feed_cache_json
+        ))
+        retagged.feed_cache.load()
+        
+        requests = []
+        client = feed_client(httpx.Response(200, text=SAMPLE_RSS_FEED), requests=requests)
+        new_item = FeedItem(title="Rebuilt Deal", link="https://example.com/deal1")
+        
+        with patch.object(retagged, '_process_feed_entry', return_value=new_item) as mock_process:
+            await retagged._scrape_single_feed("https://example.com/feed", client)
+        
+        assert 'If-None-Match' not in requests[0].headers
+        assert mock_process.call_count == 2
+    
+    async def test_scrape_single_feed_retries_failed_entry_fetches(self, test_config, tmp_path):
+        """Test that items whose page fetch failed aren't cached and are rebuilt next run."""
+        test_config.feed_cache_json = str(tmp_path / "feed_cache.json")
+        page = '<html><body><a href="https://amazon.com/dp/B123">Deal</a></body></html>'
+        
+        def client_for(entry_response):
+            def handler(request):
+                if request.url.path == "/feed":
+                    return httpx.Response(200, text=SAMPLE_RSS_FEED, headers={'etag': '"v1"'})
+                if isinstance(entry_response, Exception):
+                    raise entry_response
+                return entry_response
+            return AsyncClient(transport=httpx.MockTransport(handler))
+        
+        # Run 1: every entry page times out or errors
+        scraper = RSSFeedScraper(test_config)
+        await scraper._scrape_single_feed(
+            "https://example.com/feed", client_for(httpx.ConnectTimeout("timed out"))
+        )
+        scraper.feed_cache.save()
+        
+        cached = scraper.feed_cache.get("https://example.com/feed")
+        assert cached.items == []
+        assert cached.etag is None
+        
+        # Run 2: pages load, so the deals are processed and tagged
+        scraper = RSSFeedScraper(test_config)
+        scraper.feed_cache.load()
+        result = await scraper._scrape_single_feed(
+            "https://example.com/feed",
+            client_for(httpx.Response(200, text=page, headers={'content-type': 'text/html'}))
+        )
+        
+        assert [item.affiliate_count for item in result.items] == [1, 1]
+        assert "tag=test-20" in str(result.items[0].processed_links[0].final)
+        assert len(scraper.feed_cache.get("https://example.com/feed").items) == 2
+    
+    async def test_scrape_single_feed_reuses_items_for_unnormalized_links(self, test_config, tmp_path):
+        """Test that cached items are found for entry links HttpUrl rewrites."""
+        test_config.feed_cache_json = str(tmp_path / "feed_cache.json")
+        scraper = RSSFeedScraper(test_config)
+        cached_item = FeedItem(title="Cached Deal", link="https://Example.com")
+        assert str(cached_item.link) == "https://example.com/"
+        scraper.feed_cache.update("https://example.com/feed", [cached_item])
+        
+        feed = SAMPLE_RSS_FEED.replace("https://example.com/deal1", "https://Example.com")
+        client = feed_client(httpx.Response(200, text=feed))
+        new_item = FeedItem(title="Another Great Deal", link="https://example.com/deal2")
+        
+        with patch.object(scraper, '_process_feed_entry', return_value=new_item) as mock_process:
+            result = await scraper._scrape_single_feed("https://example.com/feed", client)
+        
+        assert mock_process.call_count == 1
+        assert result.items == [cached_item, new_item]
+    
+    async def test_scrape_single_feed_skips_entries_before_watermark(self, test_config, mock_httpx_client, tmp_path):
+        """Test that uncached entries up to the watermark are not fetched again."""
+        from datetime import datetime
+        
+        test_config.feed_cache_json = str(tmp_path / "feed_cache.json")
+        scraper = RSSFeedScraper(test_config)
+        scraper.feed_cache.update("https://example.com/feed", [], watermark=datetime(2024, 1, 1, 12, 0, 0))
+        
+        new_item = FeedItem(title="Another Great Deal", link="https://example.com/deal2")
+        
+        with patch.object(scraper, '_process_feed_entry', return_value=new_item) as mock_process:
+            result = await scraper._scrape_single_feed("https://example.com/feed", mock_httpx_client)
+        
+        # Only the entry published after the watermark is processed
+        assert mock_process.call_count == 1
+        assert mock_process.call_args[0][0].title == "Another Great Deal"
+        assert result.items == [new_item]
+        # Skipped entries still count as seen, so the watermark advances
+        assert scraper.feed_cache.get("https://example.com/feed").watermark == datetime(2024, 1, 2, 12, 0, 0)
+    
+    async def test_scrape_single_feed_keeps_cached_items_before_watermark(self, test_config, tmp_path):
+        """Test that a cached entry with an unnormalized link isn't skipped as seen."""
+        from datetime import datetime
+        
+        test_config.feed_cache_json = str(tmp_path / "feed_cache.json")
+        scraper = RSSFeedScraper(test_config)
+        cached_item = FeedItem(title="Cached Deal", link="https://Example.com")
+        scraper.feed_cache.update(
+            "https://example.com/feed",
+            [cached_item],
+            watermark=datetime(2024, 1, 2, 12, 0, 0)
+        )
+        
+        feed = SAMPLE_RSS_FEED.replace("https://example.com/deal1", "https://Example.com")
+        client = feed_client(httpx.Response(200, text=feed))
+        
+        with patch.object(scraper, '_process_feed_entry') as mock_process:
+            result = await scraper._scrape_single_feed("https://example.com/feed", client)
+        
+        # The uncached entry is up to the watermark, the cached one is reused
+        mock_process.assert_not_called()
+        assert result.items == [cached_item]
+        assert scraper.feed_cache.get("https://example.com/feed").items == [cached_item]
+    
+    async def test_parse_feed_in_process_pool(self, test_config):
+        """Test that feeds parsed in worker processes come back intact."""
+        from concurrent.futures import ProcessPoolExecutor
+        
+        scraper = RSSFeedScraper(test_config)
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            scraper._cpu_pool = pool
+            feed = await scraper._parse_feed(SAMPLE_RSS_FEED.encode('utf-8'))
+            malformed = await scraper._parse_feed(b"<rss><channel><item>&nbsp;")
+        
+        assert feed.version == "rss20"
+        assert [entry.title for entry in feed.entries] == ["Test Deal: Amazing Product", "Another Great Deal"]
+        assert malformed.bozo
+        assert isinstance(malformed.bozo_exception, str)
+    
+    async def test_scrape_single_feed_network_error(self, test_config):
         """Test handling of network errors during feed scraping."""
         # Mock network error
-        mock_httpx_client.get.side_effect = httpx.RequestError("Network error")
+        client = feed_client(httpx.ConnectError("Network error"))
         
         scraper = RSSFeedScraper(test_config)
         result = await scraper._scrape_single_feed(
             "https://example.com/feed", 
-            mock_httpx_client
+            client
         )
         
         assert isinstance(result, ScrapingResult)
@@ -119,35 +342,89 @@ class TestRSSFeedScraper:
         assert "Network error" in result.errors[0]
         assert len(result.items) == 0
     
-    @pytest.mark.asyncio
-    async def test_scrape_malformed_feed(self, test_config, mock_httpx_client):
+    async def test_scrape_malformed_feed(self, test_config):
         """Test handling of malformed RSS feeds."""
         malformed_feed = "<invalid>xml content</invalid>"
-        
-        mock_response = MagicMock()
-        mock_response.content = malformed_feed.encode('utf-8')
-        mock_response.raise_for_status.return_value = None
-        mock_httpx_client.get.return_value = mock_response
+        client = feed_client(httpx.Response(200, text=malformed_feed))
         
         scraper = RSSFeedScraper(test_config)
         result = await scraper._scrape_single_feed(
             "https://example.com/feed", 
-            mock_httpx_client
+            client
         )
         
         assert isinstance(result, ScrapingResult)
         # feedparser should handle malformed feeds gracefully
         assert len(result.errors) > 0 or result.total_items == 0
     
-    @pytest.mark.asyncio
+    async def test_scrape_non_feed_skips_parsing(self, test_config):
+        """Test that bodies without an XML declaration or feed root are rejected unparsed."""
+        client = feed_client(httpx.Response(200, text="<!DOCTYPE html><html><body>Error</body></html>"))
+        scraper = RSSFeedScraper(test_config)
+        
+        with patch.object(scraper, '_parse_feed') as mock_parse:
+            result = await scraper._scrape_single_feed("https://example.com/feed", client)
+        
+        mock_parse.assert_not_called()
+        assert result.errors == ["Not an RSS/Atom feed: https://example.com/feed"]
+        assert result.total_items == 0
+    
+    async def test_scrape_feed_with_long_prolog(self, test_config):
+        """Test that a feed whose root element follows a long prolog is still parsed."""
+        prolog = "<!-- " + "Generated by a feed plugin. " * 80 + "-->\n"
+        body = prolog + SAMPLE_RSS_FEED.split("?>", 1)[1]
+        assert "<?xml" not in body and body.index("<rss") > 1024
+        client = feed_client(httpx.Response(200, text=body))
+        scraper = RSSFeedScraper(test_config)
+        
+        with patch.object(scraper, '_process_feed_entry', return_value=None):
+            result = await scraper._scrape_single_feed("https://example.com/feed", client)
+        
+        assert result.errors == []
+        assert result.total_items == 2
+    
+    @pytest.mark.parametrize("leading", [b"\xef\xbb\xbf", b"\r\n\t  ", b"\xef\xbb\xbf\n  "])
+    async def test_scrape_html_served_feed_with_leading_bytes(self, test_config, leading):
+        """Test that a feed served as text/html after a BOM or whitespace is parsed."""
+        prolog = "<!-- " + "Generated by a feed plugin. " * 80 + "-->\n"
+        body = leading + (prolog + SAMPLE_RSS_FEED.split("?>", 1)[1]).encode('utf-8')
+        client = feed_client(httpx.Response(
+            200, content=body, headers={'content-type': 'text/html; charset=utf-8'}
+        ))
+        scraper = RSSFeedScraper(test_config)
+        
+        with patch.object(scraper, '_process_feed_entry', return_value=None):
+            result = await scraper._scrape_single_feed("https://example.com/feed", client)
+        
+        assert result.errors == []
+        assert result.total_items == 2
+    
+    @pytest.mark.parametrize("leading", [b"", b"\xef\xbb\xbf", b"\n  "])
+    async def test_scrape_html_error_page_rejected(self, test_config, leading):
+        """Test that an HTML error page is rejected without being parsed."""
+        body = leading + (
+            b"<!DOCTYPE html>\n<html><head><title>502 Bad Gateway</title></head>"
+            b"<body>" + b"Upstream unavailable. " * 100 + b"</body></html>"
+        )
+        client = feed_client(httpx.Response(200, content=body, headers={'content-type': 'text/html'}))
+        scraper = RSSFeedScraper(test_config)
+        
+        with patch.object(scraper, '_parse_feed') as mock_parse:
+            result = await scraper._scrape_single_feed("https://example.com/feed", client)
+        
+        mock_parse.assert_not_called()
+        assert result.items == []
+        assert result.errors == ["Not an RSS/Atom feed: https://example.com/feed"]
+    
     async def test_process_feed_entry_success(self, test_config, mock_httpx_client):
         """Test successful processing of a single feed entry."""
         # Create mock entry
-        entry = MagicMock()
-        entry.title = "Test Entry"
-        entry.link = "https://example.com/entry"
-        entry.summary = "Test summary"
-        entry.published_parsed = (2024, 1, 1, 12, 0, 0, 0, 1, 0)
+        entry = SimpleNamespace(
+            title="Test Entry",
+            link="https://example.com/entry",
+            summary="Test summary",
+            published_parsed=(2024, 1, 1, 12, 0, 0, 0, 1, 0)
+        )
         
         scraper = RSSFeedScraper(test_config)
         
@@ -176,12 +453,9 @@ class TestRSSFeedScraper:
         assert len(result.processed_links) == 1
         assert result.processed_links[0].is_affiliate
     
-    @pytest.mark.asyncio
     async def test_process_feed_entry_no_link(self, test_config, mock_httpx_client):
         """Test handling of feed entry without link."""
-        entry = MagicMock()
-        entry.title = "Test Entry"
-        entry.link = ""  # No link
+        entry = SimpleNamespace(title="Test Entry", link="")  # No link
         
         scraper = RSSFeedScraper(test_config)
         result = await scraper._process_feed_entry(
@@ -190,14 +464,36 @@ class TestRSSFeedScraper:
         
         assert result is None
     
+    async def test_duplicate_entries_fetched_once(self, test_config, mock_httpx_client):
+        """Test that republished articles share one page fetch and link pass."""
+        scraper = RSSFeedScraper(test_config)
+        first = SimpleNamespace(title="Deal", link="https://Example.com/deal?utm_source=feed1")
+        second = SimpleNamespace(title="Same Deal", link="https://example.com/deal?utm_source=feed2#top")
+        
+        async def slow_fetch(url, client):
+            await asyncio.sleep(0.01)
+            return SAMPLE_HTML_CONTENT
+        
+        with patch.object(scraper, '_fetch_entry_content', side_effect=slow_fetch) as mock_fetch:
+            with patch.object(scraper.link_processor, 'process_content_links', return_value=[]) as mock_links:
+                items = await asyncio.gather(
+                    scraper._process_feed_entry(first, "feed1.com", mock_httpx_client),
+                    scraper._process_feed_entry(second, "feed1.com", mock_httpx_client)
+                )
+        
+        assert [item.title for item in items] == ["Deal", "Same Deal"]
+        assert mock_fetch.call_count == 1
+        assert mock_links.call_count == 1
+    
     def test_extract_entry_content(self, test_config):
         """Test content extraction from RSS entry."""
         scraper = RSSFeedScraper(test_config)
         
         # Test with content field
-        entry = MagicMock()
-        entry.content = [{'value': 'Content from content field'}]
-        entry.summary = 'Summary content'
+        entry = SimpleNamespace(
+            content=[{'value': 'Content from content field'}],
+            summary='Summary content'
+        )
         
         result = scraper._extract_entry_content(entry)
         assert result == 'Content from content field'
@@ -213,33 +509,23 @@ class TestRSSFeedScraper:
         result = scraper._extract_entry_content(entry)
         assert result == ""
     
-    @pytest.mark.asyncio
     async def test_fetch_entry_content_success(self, test_config, mock_httpx_client):
         """Test successful content fetching from entry URL."""
-        mock_response = MagicMock()
-        mock_response.text = SAMPLE_HTML_CONTENT
-        mock_response.headers = {'content-type': 'text/html'}
-        mock_response.raise_for_status.return_value = None
-        mock_httpx_client.get.return_value = mock_response
+        client = html_client(SAMPLE_HTML_CONTENT)
         
         scraper = RSSFeedScraper(test_config)
         
         with patch.object(scraper, '_needs_js_rendering', return_value=False):
             result = await scraper._fetch_entry_content(
                 "https://example.com/entry", 
-                mock_httpx_client
+                client
             )
         
         assert result == SAMPLE_HTML_CONTENT
     
-    @pytest.mark.asyncio
     async def test_fetch_entry_content_with_js_fallback(self, test_config, mock_httpx_client):
         """Test content fetching with JavaScript fallback."""
-        mock_response = MagicMock()
-        mock_response.text = "<div>Loading...</div>"  # Needs JS
-        mock_response.headers = {'content-type': 'text/html'}
-        mock_response.raise_for_status.return_value = None
-        mock_httpx_client.get.return_value = mock_response
+        client = html_client("<div>Loading...</div>")  # Needs JS
         
         # Enable Playwright for this test
         test_config.use_playwright = True
@@ -250,34 +536,64 @@ class TestRSSFeedScraper:
             
             result = await scraper._fetch_entry_content(
                 "https://example.com/entry", 
-                mock_httpx_client
+                client
             )
         
         assert result == SAMPLE_HTML_CONTENT
         mock_js.assert_called_once()
     
-    @pytest.mark.asyncio
-    async def test_needs_js_rendering(self, test_config):
+    async def test_fetch_entry_content_streaming_limits(self, test_config):
+        """Test that non-HTML bodies are skipped and large pages are capped."""
+        scraper = RSSFeedScraper(test_config)
+        
+        pdf_client = html_client("%PDF-1.4", content_type='application/pdf')
+        assert await scraper._fetch_entry_content("https://example.com/file.pdf", pdf_client) == ""
+        
+        large_page = "<html><body>" + "<p>deal</p>" * 100 + "</body></html>"
+        with patch('scraper.main._MAX_CONTENT_BYTES', 100):
+            with patch.object(scraper, '_needs_js_rendering', return_value=False):
+                result = await scraper._fetch_entry_content("https://example.com/entry", html_client(large_page))
+        
+        assert large_page.startswith(result)
+        assert len(result) == 100
+    
+    def test_needs_js_rendering(self, test_config):
         """Test JavaScript rendering detection."""
         scraper = RSSFeedScraper(test_config)
         
         # Test content that needs JS
         js_content = '<div id="root"></div>'
-        assert await scraper._needs_js_rendering(js_content) == True
+        assert scraper._needs_js_rendering(js_content) == True
         
         # Test content with React
         react_content = '<div data-reactroot></div>'
-        assert await scraper._needs_js_rendering(react_content) == True
+        assert scraper._needs_js_rendering(react_content) == True
         
         # Test normal HTML content
         normal_content = SAMPLE_HTML_CONTENT
-        assert await scraper._needs_js_rendering(normal_content) == False
+        assert scraper._needs_js_rendering(normal_content) == False
         
         # Test very short content
         short_content = '<p>Test</p>'
-        assert await scraper._needs_js_rendering(short_content) == True
+        assert scraper._needs_js_rendering(short_content) == True
+    
+    def test_needs_js_rendering_ignores_case(self, test_config):
+        """Test that SPA indicators match regardless of case in long pages."""
+        scraper = RSSFeedScraper(test_config)
+        padding = "<p>" + "Deal text. " * 60 + "</p>"
+        
+        assert scraper._needs_js_rendering(f'<DIV ID="APP">{padding}') == True
+        assert scraper._needs_js_rendering(f'{padding}please enable javascript') == True
+        assert scraper._needs_js_rendering(padding) == False
+    
+    def test_needs_js_rendering_scans_prefix_only(self, test_config):
+        """Test that indicators deep inside a large page are not scanned."""
+        scraper = RSSFeedScraper(test_config)
+        padding = "<p>" + "Deal text. " * 1000 + "</p>"
+        
+        assert scraper._needs_js_rendering(f'<div id="root">{padding}') == True
+        assert scraper._needs_js_rendering(f'{padding}<div id="root">') == False
     
-    @pytest.mark.asyncio
     async def test_save_results(self, test_config, tmp_path):
         """Test saving results to JSON file."""
         # Create test results
@@ -310,6 +626,47 @@ class TestRSSFeedScraper:
         assert data[0]['title'] == "Test Item"
         assert data[0]['link'] == "https://example.com/item"
     
+    async def test_save_results_json_format(self, test_config, tmp_path):
+        """Test that output keeps non-ASCII text and uses ISO 8601 dates."""
+        from datetime import datetime
+        
+        feed_item = FeedItem(
+            title="Café Deal",
+            link="https://example.com/item",
+            published=datetime(2024, 1, 1, 12, 0, 0)
+        )
+        output_file = tmp_path / "test_output.json"
+        test_config.output_json = str(output_file)
+        
+        scraper = RSSFeedScraper(test_config)
+        await scraper.save_results([ScrapingResult(feed_url="https://example.com/feed", items=[feed_item])])
+        
+        raw = output_file.read_text(encoding='utf-8')
+        assert '"title": "Café Deal"' in raw
+        assert json.loads(raw)[0]['published'] == "2024-01-01T12:00:00"
+    
+    async def test_save_results_replaces_output_atomically(self, test_config, tmp_path):
+        """Test that output replaces the previous file and leaves no temp file."""
+        output_file = tmp_path / "test_output.json"
+        output_file.write_text("stale", encoding='utf-8')
+        test_config.output_json = str(output_file)
+        
+        items = [
+            FeedItem(title=f"Item {i}", link=f"https://example.com/item{i}")
+            for i in range(3)
+        ]
+        scraper = RSSFeedScraper(test_config)
+        await scraper.save_results([
+            ScrapingResult(feed_url="https://example.com/feed", items=items[:2]),
+            ScrapingResult(feed_url="https://example.com/other", items=items[2:]),
+        ])
+        
+        assert [item['title'] for item in json.loads(output_file.read_text())] == ["Item 0", "Item 1", "Item 2"]
+        assert list(tmp_path.iterdir()) == [output_file]
+        
+        await scraper.save_results([])
+        assert json.loads(output_file.read_text()) == []
+    
     def test_update_stats(self, test_config):
         """Test statistics updating."""
         scraper = RSSFeedScraper(test_config)
@@ -345,9 +702,42 @@ class TestRSSFeedScraper:
         assert scraper.stats.total_items_scraped == initial_items + 1
         assert scraper.stats.total_links_processed == initial_links + 1
         assert scraper.stats.total_affiliate_links == initial_affiliate + 1
+    
+    def test_update_stats_sums_links_across_items(self, test_config):
+        """Test that link totals cover every item of a result."""
+        scraper = RSSFeedScraper(test_config)
+        
+        def link(url, is_affiliate):
+            return ProcessedLink(
+                original=url, resolved=url, final=url,
+                is_affiliate=is_affiliate, network="amazon" if is_affiliate else "unknown"
+            )
+        
+        result = ScrapingResult(
+            feed_url="https://example.com/feed",
+            items=[
+                FeedItem(
+                    title="First",
+                    link="https://example.com/1",
+                    processed_links=[link("https://amazon.com/dp/A", True), link("https://other.com/a", False)]
+                ),
+                FeedItem(
+                    title="Second",
+                    link="https://example.com/2",
+                    processed_links=[link("https://amazon.com/dp/B", True)]
+                ),
+                FeedItem(title="Third", link="https://example.com/3"),
+            ]
+        )
+        
+        scraper._update_stats(result)
+        scraper._update_stats(result)
+        
+        assert scraper.stats.total_feeds_processed == 2
+        assert scraper.stats.total_links_processed == 6
+        assert scraper.stats.total_affiliate_links == 4
 
 
-@pytest.mark.asyncio
 async def test_main_function_success(test_config, tmp_path):
     """Test main function execution."""
     # Set up temporary output file
@@ -376,7 +766,6 @@ async def test_main_function_success(test_config, tmp_path):
                 mock_save.assert_called_once()
 
 
-@pytest.mark.asyncio 
 async def test_scrape_all_feeds_concurrent(test_config):
     """Test concurrent processing of multiple feeds."""
     # Configure multiple feeds
@@ -400,4 +789,56 @@ async def test_scrape_all_feeds_concurrent(test_config):
     assert all(isinstance(r, ScrapingResult) for r in results)
     
     # Check that stats were updated
-    assert scraper.stats.total_feeds_processed == 3
\ No newline at end of file
+    assert scraper.stats.total_feeds_processed == 3
+    
+    # The parsing pool is reused by later runs until the scraper is closed
+    pool = scraper._cpu_pool
+    with patch.object(scraper, '_scrape_single_feed', side_effect=mock_scrape_single):
+        await scraper.scrape_all_feeds()
+    assert scraper._cpu_pool is pool
+    
+    scraper.close()
+    assert scraper._cpu_pool is None
+
+async def test_scrape_all_feeds_worker_pool(test_config):
+    """Test that feeds are drained by a bounded worker pool in feed order."""
+    test_config.rss_sources = [f"https://feed{i}.com/rss" for i in range(5)]
+    test_config.max_concurrent_feeds = 2
+    scraper = RSSFeedScraper(test_config)
+    active = 0
+    peak = 0
+    
+    async def mock_scrape_single(feed_url, client):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01 if feed_url.startswith("https://feed0") else 0)
+        active -= 1
+        if feed_url == "https://feed3.com/rss":
+            raise RuntimeError("boom")
+        return ScrapingResult(feed_url=feed_url, items=[])
+    
+    with patch.object(scraper, '_scrape_single_feed', side_effect=mock_scrape_single):
+        with patch('scraper.main.close_renderer') as mock_close:
+            results = await scraper.scrape_all_feeds()
+    
+    # The shared JS renderer is released once the run finishes
+    mock_close.assert_awaited_once()
+    assert peak == 2
+    assert [str(r.feed_url) for r in results] == [
+        "https://feed0.com/rss",
+        "https://feed1.com/rss",
+        "https://feed2.com/rss",
+        "https://feed4.com/rss",
+    ]
+
+
+@pytest.fixture(scope="session")
+async def session_loop():
+    """Event loop that session-scoped async fixtures run in."""
+    return asyncio.get_running_loop()
+
+
+async def test_tests_share_session_event_loop(session_loop):
+    """Test that async tests run in the session-wide event loop."""
+    assert asyncio.get_running_loop() is session_loop
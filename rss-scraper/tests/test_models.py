@@ -1,11 +1,12 @@
 """Tests for Pydantic models."""
 
+import html
 from datetime import datetime
 
 import pytest
 from pydantic import ValidationError
 
-from scraper.models import ProcessedLink, FeedItem, ScrapingResult, ScrapingStats
+from scraper.models import ProcessedLink, FeedItem, ScrapingResult, ScrapingStats, _unescape
 
 
 class TestProcessedLink:
@@ -49,6 +50,34 @@ class TestProcessedLink:
                 is_affiliate=False
             )
     
+    def test_repeated_urls_share_parsed_value(self):
+        """Test links built from the same URL string reuse its HttpUrl."""
+        first = ProcessedLink(
+            original="https://example.com/shared",
+            resolved="https://example.com/shared",
+            final="https://example.com/shared",
+            is_affiliate=False
+        )
+        second = ProcessedLink(
+            original="https://example.com/shared",
+            resolved="https://example.com/shared",
+            final="https://example.com/shared",
+            is_affiliate=False
+        )
+        
+        assert first.original is second.original
+        assert first.final is second.resolved
+        
+        # Invalid strings are not cached and keep failing validation
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                ProcessedLink(
+                    original="not-a-url",
+                    resolved="https://example.com/shared",
+                    final="https://example.com/shared",
+                    is_affiliate=False
+                )
+    
     def test_network_validation(self):
         """Test network field validation."""
         # Valid network
@@ -61,6 +90,16 @@ class TestProcessedLink:
         )
         assert link.network == "amazon"
         
+        # Normalized names are shared rather than copied per link
+        upper = ProcessedLink(
+            original="https://example.com",
+            resolved="https://example.com",
+            final="https://example.com",
+            is_affiliate=False,
+            network="AMAZON"
+        )
+        assert upper.network is link.network
+        
         # Invalid network should default to "unknown"
         link = ProcessedLink(
             original="https://example.com",
@@ -162,6 +201,18 @@ class TestFeedItem:
         assert len(item.summary) <= 500
         assert item.summary.endswith("...")
     
+    @pytest.mark.parametrize("text", [
+        "Plain text",
+        "Sony &amp; Bose &quot;deal&quot; &lt;today&gt; &#39;only&#39;",
+        "&amp;lt;not a tag&amp;gt;",
+        "Price&nbsp;drop &amp; more",
+        "&#8217;Tis &#x2014; season",
+        "AT&T &amp; co",
+    ])
+    def test_unescape_matches_html_unescape(self, text):
+        """Test the common-entity fast path decodes exactly like html.unescape."""
+        assert _unescape(text) == html.unescape(text)
+    
     def test_affiliate_links_property(self):
         """Test affiliate_links property."""
         affiliate_link = ProcessedLink(
@@ -188,6 +239,23 @@ class TestFeedItem:
         
         assert len(item.affiliate_links) == 1
         assert item.affiliate_links[0].is_affiliate is True
+        assert item.affiliate_count == 1
+        
+        # Replacing the links recounts them
+        item.processed_links = [affiliate_link, affiliate_link]
+        assert item.affiliate_count == 2
+        
+        # The count survives a serialization round trip
+        restored = FeedItem.model_validate_json(item.model_dump_json())
+        assert restored.affiliate_count == 2
+        
+        # In-place changes and copies are counted too
+        item.processed_links.append(affiliate_link)
+        assert item.affiliate_count == len(item.affiliate_links) == 3
+        assert item.model_copy(update={"processed_links": []}).affiliate_count == 0
+        non_affiliate_link.is_affiliate = True
+        item.processed_links.append(non_affiliate_link)
+        assert item.affiliate_count == len(item.affiliate_links) == 4
     
     def test_link_count_property(self):
         """Test link_count property."""